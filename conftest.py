@@ -1,14 +1,42 @@
+import json
 import os
+import time
 
 import pytest
 from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
 
+from drivers.app_state import AppStateStore, CommandRunner
 from drivers.driver_factory import Driver
 from drivers.event_listener import AppEventListener
-from utils.logger import Logger, LogLevel
+from drivers.perf_sampler import (
+    AdbPerfSource,
+    AppiumPerfSource,
+    PerfSampler,
+    detect_regressions,
+    load_baseline,
+)
+from drivers.session_health import SessionHealth
+from locators.fallback_index import FallbackIndex
+from screens.checkpoint import StepStats
+from screens.element_cache import CacheStats
+from utils.log_merge import LOG_DIR, merge_logs, remove_stale_shards, shards
+from utils.logger import Logger, LogLevel, worker_id
+from utils.sharded_report import ShardedReport, store_artifact
 
 log = Logger(log_lvl=LogLevel.INFO).get_instance()
 
+# {test: {step: {metric: stats}}} of the tests run by this process
+perf_results = {}
+perf_regressions = []
+
+# Per-process run statistics, pytest-xdist workers send them to the controller
+RUN_STATS = {
+    "session_health": SessionHealth,
+    "step_retries": StepStats,
+    "element_cache": CacheStats,
+    "healed_locators": FallbackIndex,
+}
+
 
 @pytest.hookimpl
 def pytest_addoption(parser):
@@ -36,6 +64,71 @@ def pytest_addoption(parser):
         default="events",
         help="Define listeners for the test run",
     )
+    parser.addoption(
+        "--app-state-snapshots",
+        action="store_true",
+        default=False,
+        help="Store app states as emulator AVD snapshots instead of app data",
+    )
+    parser.addoption(
+        "--record-locators",
+        action="store_true",
+        default=False,
+        help="Record alternatives of Locators to the fallback index on a green run",
+    )
+    parser.addoption(
+        "--no-heal-locators",
+        action="store_true",
+        default=False,
+        help="Do not try fallback index alternatives for missing locators",
+    )
+    parser.addoption(
+        "--perf",
+        action="store_true",
+        default=False,
+        help="Sample device performance metrics while tests run",
+    )
+    parser.addoption(
+        "--perf-source",
+        action="store",
+        default="adb",
+        choices=["adb", "appium"],
+        help="adb (low overhead, bypasses the Appium session) or appium",
+    )
+    parser.addoption(
+        "--perf-interval",
+        action="store",
+        type=float,
+        default=1.0,
+        help="Performance sampling interval in seconds",
+    )
+    parser.addoption(
+        "--perf-baseline",
+        action="store",
+        default=None,
+        help="Performance summary of a good run to detect regressions against",
+    )
+    parser.addoption(
+        "--perf-tolerance",
+        action="store",
+        type=float,
+        default=0.2,
+        help="Allowed relative growth of performance metrics (0.2 = 20%%)",
+    )
+
+
+def pytest_configure(config):
+    """Registers the sharded JSON lines report and loads the locator fallback index."""
+    fallback = FallbackIndex()
+    fallback.configure(
+        recording=config.getoption("--record-locators"),
+        healing=not config.getoption("--no-heal-locators"),
+    )
+    if not hasattr(config, "workerinput"):
+        # Controller, before workers start: only files of this run are merged
+        remove_stale_shards(keep=Logger().log_file)
+        fallback.clear_partials()
+    config.pluginmanager.register(ShardedReport(worker_id()), "sharded_report")
 
 
 @pytest.fixture(scope="session")
@@ -57,18 +150,82 @@ def device(request):
 @pytest.fixture(scope="function")
 def driver(request):
     platform = request.config.getoption("--platform")
+    health = SessionHealth()
+    # Previous session died, the server may still be restarting
+    retries = 3 if health.is_open else 1
 
     try:
         e_listener = AppEventListener()
-        driver = Driver.get_driver(platform)
+        driver = Driver.get_driver(platform, retries=retries)
         event_driver = EventFiringWebDriver(driver, e_listener)
     except Exception as e:
         pytest.fail(f"Failed to initialize driver: {e}")
 
+    health.reset()
     yield event_driver
 
     if event_driver is not None:
-        event_driver.quit()
+        try:
+            event_driver.quit()
+        except Exception as e:
+            if not health.is_open:
+                raise
+            log.info(f"Dead session replaced for the next test: {e}")
+
+
+@pytest.fixture(scope="function")
+def app_state(request, driver):
+    """
+    App state store, restores states captured by earlier tests or runs.
+    """
+    platform = request.config.getoption("--platform")
+    caps = driver.capabilities
+    app_id = caps.get("appPackage") or caps.get("bundleId")
+    store = AppStateStore.for_platform(
+        platform, snapshots=request.config.getoption("--app-state-snapshots")
+    )
+
+    if store.backend.restarts_session:
+        # The snapshot load killed the session, the snapshot app is in foreground
+        store.on_restore = lambda: Driver.restart_session(
+            driver.wrapped_driver, platform
+        )
+    else:
+        store.on_restore = lambda: driver.activate_app(app_id)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def perf_sampler(request):
+    """
+    Samples device performance metrics in the background while a test runs (--perf).
+    """
+    if not request.config.getoption("--perf") or "driver" not in request.fixturenames:
+        yield None
+        return
+
+    driver = request.getfixturevalue("driver")
+    package = driver.capabilities.get("appPackage")
+    if package is None:
+        log.info("Performance sampling is supported on Android only.")
+        yield None
+        return
+
+    if request.config.getoption("--perf-source") == "adb":
+        source = AdbPerfSource(CommandRunner(), package, driver.capabilities.get("udid"))
+    else:
+        source = AppiumPerfSource(driver, package)
+
+    sampler = PerfSampler(source, interval=request.config.getoption("--perf-interval"))
+    sampler.start(request.node.nodeid)
+    yield sampler
+    sampler.stop()
+    perf_results.update(sampler.summary())
+
+
+def pytest_runtest_setup(item):
+    """Test start for the time saved by step retries, setup is part of a rerun."""
+    StepStats().begin_test(item.nodeid)
 
 
 def pytest_runtest_makereport(item, call):
@@ -76,15 +233,13 @@ def pytest_runtest_makereport(item, call):
     if call.excinfo is not None:
         driver = item.funcargs.get("driver", None)
 
-        if driver is not None:
-            screenshot_dir = "reports/screenshots"
-            os.makedirs(
-                screenshot_dir, exist_ok=True
-            )  # Create directory if it does not exist
-            screenshot_path = os.path.join(screenshot_dir, f"{item.name}.png")
-
+        if SessionHealth().is_open:
+            log.error("Session is dead, skipping screenshot.")
+        elif driver is not None:
             try:
-                driver.save_screenshot(screenshot_path)
+                # Stored by content hash and referenced from the report
+                screenshot_path = store_artifact(driver.get_screenshot_as_png())
+                item.user_properties.append(("screenshot", screenshot_path))
                 log.info(f"Screenshot saved to: {screenshot_path}")
             except Exception as e:
                 pass
@@ -92,3 +247,92 @@ def pytest_runtest_makereport(item, call):
         else:
             pass
             log.error("Driver instance is not available for capturing screenshot.")
+
+
+def pytest_sessionfinish(session):
+    """Save performance results and the locator index, merge log shards."""
+    recording = session.config.getoption("--record-locators")
+    # Workers finish compressing segments before the controller merges them
+    Logger().drain()
+
+    if perf_results:
+        perf_dir = os.path.join(os.path.dirname(LOG_DIR), "perf")
+        os.makedirs(perf_dir, exist_ok=True)
+        perf_file = os.path.join(perf_dir, f"perf-{worker_id()}.json")
+        with open(perf_file, "w", encoding="utf-8") as f:
+            json.dump(perf_results, f, indent=2)
+
+        baseline = session.config.getoption("--perf-baseline")
+        if baseline:
+            perf_regressions.extend(
+                detect_regressions(
+                    perf_results,
+                    load_baseline(baseline),
+                    session.config.getoption("--perf-tolerance"),
+                )
+            )
+            for regression in perf_regressions:
+                log.error(f"Performance regression: {regression}")
+
+    if hasattr(session.config, "workerinput"):
+        # Worker, the controller merges after all workers finished
+        session.config.workeroutput["run_stats"] = {
+            name: stats().to_dict() for name, stats in RUN_STATS.items()
+        }
+        session.config.workeroutput["perf_regressions"] = perf_regressions
+        if recording:
+            FallbackIndex().save_partial(worker_id())
+        return
+
+    # Failures of all workers are counted on the controller
+    if recording and session.testsfailed == 0:
+        fallback = FallbackIndex()
+        fallback.merge_partials()
+        fallback.save()
+
+    log_files = shards()
+    if len(log_files) > 1:
+        output = os.path.join(LOG_DIR, f"log_{time.strftime('%Y-%m-%d')}.log")
+        merge_logs(log_files, output)
+        log.info(f"Merged {len(log_files)} log shards into: {output}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Aggregate run statistics of a finished pytest-xdist worker on the controller."""
+    output = getattr(node, "workeroutput", {})
+    for name, data in output.get("run_stats", {}).items():
+        RUN_STATS[name]().merge(data)
+    perf_regressions.extend(output.get("perf_regressions", []))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report dead sessions, performance, healed locators, step retries and cache."""
+    health = SessionHealth()
+    if health.trips:
+        terminalreporter.write_sep("-", "session health")
+        terminalreporter.write_line(health.summary())
+
+    if perf_regressions:
+        terminalreporter.write_sep("-", "performance regressions")
+        for regression in perf_regressions:
+            terminalreporter.write_line(regression)
+
+    fallback = FallbackIndex()
+    if fallback.healed:
+        terminalreporter.write_sep("-", "healed locators")
+        for line in fallback.summary():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(
+            f"Healing took {fallback.heal_seconds:.2f} seconds, update Locators"
+        )
+
+    step_stats = StepStats()
+    if step_stats.retries:
+        terminalreporter.write_sep("-", "step retries")
+        terminalreporter.write_line(step_stats.summary())
+
+    cache_stats = CacheStats()
+    if cache_stats.hits or cache_stats.misses:
+        terminalreporter.write_sep("-", "element cache")
+        terminalreporter.write_line(cache_stats.summary())
@@ -0,0 +1,334 @@
+import hashlib
+import json
+import shlex
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from drivers.android_driver import AndroidCaps
+from drivers.ios_driver import IOSCaps
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+STATE_DIR = ROOT_DIR / "reports/app_state"
+
+# App data directories captured on Android, others (lib, code_cache) are
+# owned by the system or rebuilt by the runtime
+ANDROID_DATA_DIRS = ("shared_prefs", "databases", "files", "no_backup")
+
+
+class AppStateError(RuntimeError):
+    """Raised when a device command for app state capture/restore fails."""
+
+
+class CommandRunner:
+    """Runs host commands (adb, xcrun) for the app state backends.
+
+    Injected into the backends so tests can replace it with a local fake.
+    """
+
+    def __call__(
+        self,
+        args: Sequence[str],
+        stdin_path: Optional[Path] = None,
+        stdout_path: Optional[Path] = None,
+        timeout: float = 120,
+    ) -> str:
+        """Run a command and return its stdout.
+
+        :param args: command and its arguments
+        :param stdin_path: file streamed to the command stdin
+        :param stdout_path: file the command stdout is written to (binary)
+        :param timeout: command timeout in seconds
+        """
+        stdin = open(stdin_path, "rb") if stdin_path else None
+        stdout = open(stdout_path, "wb") if stdout_path else subprocess.PIPE
+        try:
+            result = subprocess.run(
+                list(args),
+                stdin=stdin,
+                stdout=stdout,
+                stderr=subprocess.PIPE,
+                timeout=timeout,
+            )
+        finally:
+            if stdin:
+                stdin.close()
+            if stdout_path:
+                stdout.close()
+
+        if result.returncode != 0:
+            raise AppStateError(
+                f"Command {' '.join(args)} failed: {result.stderr.decode().strip()}"
+            )
+        return result.stdout.decode() if result.stdout else ""
+
+
+class AndroidAppDataBackend:
+    """Captures app data through `adb exec-out run-as <package> tar`.
+
+    Restore streams the archive back through `adb exec-in`, `exec-out` does
+    not forward stdin to the device.
+    """
+
+    name = "android-data"
+    restarts_session = False
+
+    def __init__(
+        self, runner: CommandRunner, package: str, serial: Optional[str] = None
+    ):
+        self.runner = runner
+        self.package = package
+        self.serial = serial
+
+    def _adb(self, *args: str) -> list:
+        return ["adb", *(["-s", self.serial] if self.serial else []), *args]
+
+    def _run_as(self, command: str, adb_command: str = "exec-out") -> list:
+        # adb joins the arguments with spaces for the device shell, the script
+        # must stay a single `sh -c` argument
+        return self._adb(
+            adb_command, "run-as", self.package, "sh", "-c", shlex.quote(command)
+        )
+
+    def capture(self, dest: Path) -> None:
+        dirs = " ".join(ANDROID_DATA_DIRS)
+        self.runner(
+            self._run_as(f"tar -cf - $(ls -d {dirs} 2>/dev/null)"),
+            stdout_path=dest / "data.tar",
+        )
+
+    def restore(self, src: Path) -> None:
+        self.runner(self._adb("shell", "am", "force-stop", self.package))
+        self.runner(self._run_as(f"rm -rf {' '.join(ANDROID_DATA_DIRS)}"))
+        self.runner(
+            self._run_as("tar -xf -", adb_command="exec-in"),
+            stdin_path=src / "data.tar",
+        )
+
+
+class AvdSnapshotBackend:
+    """Saves and loads whole emulator snapshots through the emulator console.
+
+    Snapshots live inside the AVD, only a marker is kept in the state directory.
+    Loading a snapshot restarts the UiAutomator2 server, so the Appium session
+    has to be restarted after `restore` (see `restarts_session`).
+    """
+
+    name = "avd-snapshot"
+    restarts_session = True
+
+    def __init__(self, runner: CommandRunner, serial: str):
+        self.runner = runner
+        self.serial = serial
+
+    def capture(self, dest: Path) -> None:
+        # <state name>_<build hash>
+        snapshot = f"{dest.parent.name}_{dest.name}"
+        self.runner(
+            ["adb", "-s", self.serial, "emu", "avd", "snapshot", "save", snapshot]
+        )
+        (dest / "snapshot").write_text(snapshot)
+
+    def restore(self, src: Path) -> None:
+        snapshot = (src / "snapshot").read_text()
+        self.runner(
+            ["adb", "-s", self.serial, "emu", "avd", "snapshot", "load", snapshot]
+        )
+
+
+class IOSSimulatorBackend:
+    """Copies the simulator data container of the app."""
+
+    name = "ios-data"
+    restarts_session = False
+
+    def __init__(self, runner: CommandRunner, bundle_id: str, udid: str = "booted"):
+        self.runner = runner
+        self.bundle_id = bundle_id
+        self.udid = udid
+
+    def _container(self) -> Path:
+        output = self.runner(
+            [
+                "xcrun",
+                "simctl",
+                "get_app_container",
+                self.udid,
+                self.bundle_id,
+                "data",
+            ]
+        )
+        return Path(output.strip())
+
+    def capture(self, dest: Path) -> None:
+        shutil.copytree(self._container(), dest / "data")
+
+    def restore(self, src: Path) -> None:
+        container = self._container()
+        try:
+            self.runner(["xcrun", "simctl", "terminate", self.udid, self.bundle_id])
+        except AppStateError:
+            pass  # App is not running
+        shutil.rmtree(container, ignore_errors=True)
+        shutil.copytree(src / "data", container)
+
+
+# (path, mtime, size) -> hash, the binary is hashed once per session
+_build_hashes = {}
+
+
+def build_hash(app_path: Optional[str]) -> str:
+    """Short sha256 of the app binary, states of other builds are invalidated.
+
+    Cached by path, modification time and size of the binary.
+    """
+    if not app_path or not Path(app_path).is_file():
+        log.warning(
+            f"App binary not found: {app_path}, app states are not invalidated "
+            "on new builds"
+        )
+        return "unknown-build"
+
+    stat = Path(app_path).stat()
+    key = (app_path, stat.st_mtime_ns, stat.st_size)
+    if key not in _build_hashes:
+        digest = hashlib.sha256()
+        with open(app_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        _build_hashes[key] = digest.hexdigest()[:16]
+    return _build_hashes[key]
+
+
+class AppStateStore:
+    """Captures app state once and restores it for later tests.
+
+    States are stored as `<root>/<state name>/<build hash>/`, a new app build
+    removes the states captured for older builds.
+
+    **Usage Example:**
+
+     app_state.ensure("logged_in", lambda: login_screen.login(user))
+    """
+
+    def __init__(
+        self,
+        backend,
+        build: str,
+        root: Path = STATE_DIR,
+        on_restore: Optional[Callable[[], None]] = None,
+    ):
+        self.backend = backend
+        self.build = build
+        self.root = Path(root)
+        self.on_restore = on_restore
+
+    def path(self, name: str) -> Path:
+        return self.root / name / self.build
+
+    def has(self, name: str) -> bool:
+        return (self.path(name) / "state.json").is_file()
+
+    def invalidate(self, name: str) -> None:
+        """Remove states of `name` captured for other app builds."""
+        state_dir = self.root / name
+        if not state_dir.is_dir():
+            return
+        for build_dir in state_dir.iterdir():
+            if build_dir.name != self.build:
+                log.info(f"Removing outdated app state: {build_dir}")
+                shutil.rmtree(build_dir, ignore_errors=True)
+
+    def capture(self, name: str) -> None:
+        self.invalidate(name)
+        path = self.path(name)
+        shutil.rmtree(path, ignore_errors=True)
+        path.mkdir(parents=True)
+
+        start = time.monotonic()
+        self.backend.capture(path)
+        meta = {
+            "name": name,
+            "build": self.build,
+            "backend": self.backend.name,
+            "captured_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "capture_seconds": round(time.monotonic() - start, 3),
+        }
+        # Written last, a state without metadata is incomplete
+        (path / "state.json").write_text(json.dumps(meta, indent=2))
+        log.info(f"Captured app state '{name}' with {self.backend.name}")
+
+    def restore(self, name: str) -> bool:
+        """Restore a captured state, returns False if there is nothing to restore."""
+        if not self.has(name):
+            return False
+
+        start = time.monotonic()
+        self.backend.restore(self.path(name))
+        if self.on_restore:
+            self.on_restore()
+        log.info(
+            f"Restored app state '{name}' in {time.monotonic() - start:.2f} seconds"
+        )
+        return True
+
+    def ensure(self, name: str, build_state: Callable[[], None]) -> bool:
+        """Restore state `name` or build it through `build_state` and capture it.
+
+        :param name: name of the state, e.g. "logged_in"
+        :param build_state: precondition flow which brings the app to the state
+        :return: True if the state was restored, False if it was built
+        """
+        if self.restore(name):
+            return True
+
+        build_state()
+        self.capture(name)
+        return False
+
+    @classmethod
+    def for_platform(
+        cls,
+        platform: str,
+        runner: Optional[CommandRunner] = None,
+        root: Path = STATE_DIR,
+        on_restore: Optional[Callable[[], None]] = None,
+        snapshots: bool = False,
+    ) -> "AppStateStore":
+        """Create a store with the backend of the platform from settings.yaml.
+
+        :param platform: android or ios
+        :param runner: command runner, `CommandRunner` by default
+        :param root: directory states are stored in
+        :param on_restore: callback run after restore, e.g. app relaunch, or a
+            session restart if the backend `restarts_session`
+        :param snapshots: use emulator AVD snapshots instead of app data
+        """
+        runner = runner or CommandRunner()
+
+        if platform.lower() == "android":
+            caps = AndroidCaps.get_caps()
+            serial = caps.get("udid")
+            if snapshots and serial and serial.startswith("emulator-"):
+                backend = AvdSnapshotBackend(runner, serial)
+            else:
+                if snapshots:
+                    log.warning(
+                        "AVD snapshots need an emulator-* udid in the capabilities "
+                        f"(got {serial}), capturing app data instead"
+                    )
+                backend = AndroidAppDataBackend(runner, caps["appPackage"], serial)
+        else:
+            caps = IOSCaps.get_caps()
+            backend = IOSSimulatorBackend(
+                runner, caps["bundleId"], caps.get("udid", "booted")
+            )
+
+        return cls(
+            backend, build_hash(caps.get("app")), root=root, on_restore=on_restore
+        )
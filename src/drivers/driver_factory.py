@@ -1,3 +1,5 @@
+import time
+
 from appium.options.android import UiAutomator2Options
 from appium.options.ios import XCUITestOptions
 from appium import webdriver
@@ -12,8 +14,12 @@ log = Logger(log_lvl=LogLevel.INFO).get_instance()
 
 class Driver:
     @staticmethod
-    def get_driver(platform: str):
-        """Get driver by platform, uses appropriate capabilities for Android or iOS."""
+    def get_options(platform: str, **overrides):
+        """Get Appium options by platform from Android or iOS capabilities.
+
+        :param platform: android or ios
+        :param overrides: capabilities replacing the configured ones
+        """
         caps = (
             AndroidCaps.get_caps()
             if platform.lower() == "android"
@@ -23,13 +29,39 @@ class Driver:
         if not caps:
             log.info(f"Capabilities not found for platform ❌: {platform}")
             raise ValueError(f"Capabilities not found for platform ❌: {platform}")
+        caps.update(overrides)
 
         if platform.lower() == "android":
             options = UiAutomator2Options().load_capabilities(caps)
-            log.info(f"Capabilities: {options}")
         else:
             options = XCUITestOptions().load_capabilities(caps)
-            log.info(f"Capabilities: {options}")
+        log.info(f"Capabilities: {options}")
+        return options
+
+    @staticmethod
+    def get_driver(platform: str, retries: int = 1, delay: float = 5):
+        """Get driver by platform, uses appropriate capabilities for Android or iOS.
+
+        :param platform: android or ios
+        :param retries: attempts to create a session, e.g. while the server restarts
+        :param delay: delay between attempts in seconds
+        """
+        options = Driver.get_options(platform)
+
+        for attempt in range(1, retries + 1):
+            try:
+                return webdriver.Remote(settings.APPIUM_SERVER, options=options)
+            except Exception as e:
+                if attempt == retries:
+                    raise
+                log.info(f"Failed to create session, retrying ({attempt}): {e}")
+                time.sleep(delay)
+
+    @staticmethod
+    def restart_session(driver, platform: str) -> None:
+        """Start a new session on the same driver, keeping the app data.
 
-        driver = webdriver.Remote(settings.APPIUM_SERVER, options=options)
-        return driver
+        Needed after the device under the session was replaced, e.g. by an
+        emulator snapshot load which also restarts the UiAutomator2 server.
+        """
+        driver.start_session(Driver.get_options(platform, noReset=True))
@@ -0,0 +1,224 @@
+import json
+import re
+import sys
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional
+
+from drivers.app_state import CommandRunner
+from screens.element_interactor import ElementInteractor
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+# Metrics where a higher value is a regression
+REGRESSION_METRICS = ("cpu", "memory", "network")
+
+
+class TimeSeries:
+    """Samples of one metric, array-backed to stay compact on long runs."""
+
+    def __init__(self) -> None:
+        self.times = array("d")
+        self.values = array("d")
+
+    def add(self, timestamp: float, value: float) -> None:
+        self.times.append(timestamp)
+        self.values.append(value)
+
+    def stats(self) -> Dict[str, float]:
+        values = sorted(self.values)
+        return {
+            "count": len(values),
+            "mean": round(sum(values) / len(values), 3),
+            "max": values[-1],
+            "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+        }
+
+
+def _sum_columns(data: List[list], columns: tuple) -> Optional[float]:
+    """Sum named columns of `get_performance_data` output ([header, *rows])."""
+    if not data or len(data) < 2:
+        return None
+    header = data[0]
+    total = 0.0
+    for row in data[1:]:
+        for column in columns:
+            if column in header and row[header.index(column)] not in (None, ""):
+                total += float(row[header.index(column)])
+    return total
+
+
+class AppiumPerfSource:
+    """Android metrics through `driver.get_performance_data`.
+
+    Commands go through the Appium session and queue with the test commands.
+    """
+
+    def __init__(self, driver, package: str):
+        self.driver = driver
+        self.package = package
+
+    def _data(self, data_type: str) -> List[list]:
+        return self.driver.get_performance_data(self.package, data_type, 1)
+
+    def sample(self) -> Dict[str, float]:
+        metrics = {
+            "cpu": _sum_columns(self._data("cpuinfo"), ("user", "kernel")),
+            "memory": _sum_columns(self._data("memoryinfo"), ("totalPss",)),
+            "battery": _sum_columns(self._data("batteryinfo"), ("power",)),
+            "network": _sum_columns(self._data("networkinfo"), ("rxBytes", "txBytes")),
+        }
+        return {name: value for name, value in metrics.items() if value is not None}
+
+
+class AdbPerfSource:
+    """Android metrics through `adb shell dumpsys`, low-overhead mode.
+
+    Bypasses the Appium session, so sampling never delays test commands.
+    """
+
+    def __init__(
+        self, runner: CommandRunner, package: str, serial: Optional[str] = None
+    ):
+        self.runner = runner
+        self.package = package
+        self.serial = serial
+
+    def _dumpsys(self, *args: str) -> str:
+        adb = ["adb", *(["-s", self.serial] if self.serial else [])]
+        return self.runner([*adb, "shell", "dumpsys", *args], timeout=10)
+
+    def sample(self) -> Dict[str, float]:
+        metrics = {}
+        cpu = re.search(
+            rf"([\d.]+)% \d+/{re.escape(self.package)}", self._dumpsys("cpuinfo")
+        )
+        if cpu:
+            metrics["cpu"] = float(cpu[1])
+        memory = re.search(
+            r"TOTAL(?: PSS:)?\s+(\d+)", self._dumpsys("meminfo", self.package)
+        )
+        if memory:
+            metrics["memory"] = float(memory[1])
+        battery = re.search(r"level: (\d+)", self._dumpsys("battery"))
+        if battery:
+            metrics["battery"] = float(battery[1])
+        return metrics
+
+
+class PerfSampler:
+    """Polls a performance source on a background thread during a test.
+
+    Samples are stored per test and per `Screen` method running on the test
+    thread at sampling time (read from its stack, no instrumentation).
+
+    **Usage Example:**
+
+     sampler = PerfSampler(AdbPerfSource(CommandRunner(), "io.appium.android.apis"))
+     sampler.start("test_swipe_to_delete")
+     ...
+     sampler.stop()
+     sampler.summary()
+    {'test_swipe_to_delete': {'MainScreen.swipe_tab': {'memory': {...}}}}
+    """
+
+    def __init__(self, source, interval: float = 1.0):
+        self.source = source
+        self.interval = interval
+        self.series: Dict[str, Dict[str, Dict[str, TimeSeries]]] = {}
+        self.sample_seconds = 0.0  # Spent on the sampler thread, not the test thread
+        self.errors = 0
+        self._test = "-"
+        self._test_thread: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, test: str) -> None:
+        self._test = test
+        self._test_thread = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="perf-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _current_step(self) -> str:
+        """Outermost Screen method on the test thread stack."""
+        frame = sys._current_frames().get(self._test_thread)
+        step = "-"
+        while frame is not None:
+            owner = frame.f_locals.get("self")
+            if isinstance(owner, ElementInteractor):
+                step = f"{type(owner).__name__}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        return step
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            start = time.monotonic()
+            try:
+                metrics = self.source.sample()
+            except Exception as e:
+                self.errors += 1
+                log.debug(f"Performance sample failed: {e}")
+                continue
+            finally:
+                self.sample_seconds += time.monotonic() - start
+
+            steps = self.series.setdefault(self._test, {})
+            series = steps.setdefault(self._current_step(), {})
+            now = time.time()
+            for metric, value in metrics.items():
+                series.setdefault(metric, TimeSeries()).add(now, value)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, dict]]]:
+        """{test: {step: {metric: stats}}}, step "*" aggregates the whole test."""
+        result = {}
+        for test, steps in self.series.items():
+            result[test] = {}
+            merged: Dict[str, TimeSeries] = {}
+            for step, metrics in steps.items():
+                result[test][step] = {m: s.stats() for m, s in metrics.items()}
+                for metric, series in metrics.items():
+                    total = merged.setdefault(metric, TimeSeries())
+                    total.times.extend(series.times)
+                    total.values.extend(series.values)
+            result[test]["*"] = {m: s.stats() for m, s in merged.items()}
+        return result
+
+
+def detect_regressions(
+    summary: dict, baseline: dict, tolerance: float = 0.2
+) -> List[str]:
+    """Compare test means with a baseline summary saved by an earlier run.
+
+    :param summary: `PerfSampler.summary()` of this run
+    :param baseline: summary of a known good run
+    :param tolerance: allowed relative growth, 0.2 = 20%
+    :return: regression descriptions
+    """
+    regressions = []
+    for test, steps in summary.items():
+        for metric, stats in steps.get("*", {}).items():
+            if metric not in REGRESSION_METRICS:
+                continue
+            expected = baseline.get(test, {}).get("*", {}).get(metric, {}).get("mean")
+            if expected and stats["mean"] > expected * (1 + tolerance):
+                regressions.append(
+                    f"{test}: {metric} mean {stats['mean']} > baseline {expected} "
+                    f"(+{(stats['mean'] / expected - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,102 @@
+from typing import Optional
+
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from urllib3.exceptions import HTTPError
+
+from utils.logger import Logger, LogLevel, Singleton
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+# Parts of Appium server errors which mean the session will not recover
+FATAL_MESSAGES = (
+    "session is either terminated or not started",
+    "invalid session id",
+    "instrumentation process is not running",
+    "could not proxy command to the remote server",
+    "socket hang up",
+    "econnrefused",
+    "econnreset",
+)
+
+
+class SessionDeadError(WebDriverException):
+    """Raised instead of retrying when the Appium session is dead."""
+
+
+class SessionHealth(metaclass=Singleton):
+    """Circuit breaker for the current Appium session.
+
+    The first session-fatal error trips the breaker, later lookups fail
+    immediately instead of retrying `n` times with a delay each. Saved time
+    counts only the skipped retry delays, a dead session does not wait.
+    The driver fixture replaces the session for the next test.
+    """
+
+    def __init__(self) -> None:
+        self.tripped_by: Optional[str] = None
+        self.trips = 0
+        self.fast_failures = 0
+        self.saved_seconds = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self.tripped_by is not None
+
+    @staticmethod
+    def is_fatal(error: BaseException) -> bool:
+        """Classify an error as session-fatal (True) or transient (False)."""
+        if isinstance(error, (InvalidSessionIdException, ConnectionError, HTTPError)):
+            return True
+        if isinstance(error, WebDriverException):
+            message = str(error).lower()
+            return any(fatal in message for fatal in FATAL_MESSAGES)
+        return False
+
+    def guard(self, error: BaseException, saved_seconds: float = 0.0) -> None:
+        """Trip the breaker and raise `SessionDeadError` if `error` is fatal.
+
+        :param error: error raised by the driver
+        :param saved_seconds: wait time of the retries skipped by failing now
+        """
+        if not self.is_fatal(error):
+            return
+
+        if not self.is_open:
+            self.tripped_by = f"{type(error).__name__}: {error}".strip()
+            self.trips += 1
+            log.error(f"Appium session is dead, failing fast: {self.tripped_by}")
+        self.saved_seconds += saved_seconds
+        raise SessionDeadError(f"Appium session is dead: {self.tripped_by}") from error
+
+    def check(self, saved_seconds: float = 0.0) -> None:
+        """Raise `SessionDeadError` if the breaker is open.
+
+        :param saved_seconds: wait time skipped by failing now
+        """
+        if self.is_open:
+            self.fast_failures += 1
+            self.saved_seconds += saved_seconds
+            raise SessionDeadError(f"Appium session is dead: {self.tripped_by}")
+
+    def reset(self) -> None:
+        """Close the breaker, called when a new session is created."""
+        self.tripped_by = None
+
+    def to_dict(self) -> dict:
+        """Counters of this process, sent from pytest-xdist workers."""
+        return {
+            "trips": self.trips,
+            "fast_failures": self.fast_failures,
+            "saved_seconds": self.saved_seconds,
+        }
+
+    def merge(self, data: dict) -> None:
+        """Add counters of another process."""
+        for key, value in data.items():
+            setattr(self, key, getattr(self, key) + value)
+
+    def summary(self) -> str:
+        return (
+            f"Dead sessions: {self.trips}, fast failures: {self.fast_failures}, "
+            f"saved: {self.saved_seconds / 60:.1f} minutes"
+        )
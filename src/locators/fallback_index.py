@@ -0,0 +1,209 @@
+import glob
+import json
+import os
+import shutil
+import time
+from typing import Dict, List, Optional, Tuple
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+from locators.locators import Locators
+from screens.page_source import PageSource
+from utils.logger import Logger, LogLevel, Singleton
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+Locator = Tuple[str, str]
+
+INDEX_FILE = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../..", "data/locator_index.json")
+)
+# Per-process recordings of pytest-xdist workers, merged by the controller
+PARTIAL_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../..", "reports/locators")
+)
+
+
+def locator_names(cls=Locators, prefix: str = "") -> Dict[Locator, str]:
+    """{locator: "main_menu.VIEWS_LINK"} of all locators declared in `Locators`."""
+    names = {}
+    for attr, value in vars(cls).items():
+        if isinstance(value, type):
+            names.update(locator_names(value, f"{prefix}{attr}."))
+        elif isinstance(value, tuple) and len(value) == 2:
+            names[value] = f"{prefix}{attr}"
+    return names
+
+
+def _literal(value: str) -> Optional[str]:
+    """XPath string literal, None if ElementTree can not express it."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return None
+
+
+def _is_unique(source: PageSource, locator: Locator) -> bool:
+    try:
+        return len(source.find_all(locator)) == 1
+    except ValueError:
+        return False
+
+
+def alternatives(source: PageSource, node, primary: Locator) -> List[list]:
+    """Ranked [by, value, kind] alternatives of a node, most specific first.
+
+    Only identity attributes are used. Positional alternatives (index in a
+    list) match another row of the same position on other screens.
+    """
+    candidates = []
+
+    desc = node.get("content-desc") or node.get("name")
+    if desc:
+        candidates.append([AppiumBy.ACCESSIBILITY_ID, desc, "accessibility_id"])
+    if node.get("resource-id"):
+        candidates.append([AppiumBy.ID, node.get("resource-id"), "id"])
+    for attr in ("text", "label"):
+        literal = _literal(node.get(attr) or "")
+        if node.get(attr) and literal:
+            xpath = f"//{node.tag}[@{attr}={literal}]"
+            candidates.append([AppiumBy.XPATH, xpath, "text"])
+            break
+
+    return [
+        candidate
+        for candidate in candidates
+        if (candidate[0], candidate[1]) != tuple(primary)
+        and _is_unique(source, (candidate[0], candidate[1]))
+    ]
+
+
+class FallbackIndex(metaclass=Singleton):
+    """Alternative locators of `Locators`, recorded from page sources of green runs.
+
+    When a primary locator misses on a quick probe, `heal` picks the first
+    alternative matching exactly one element in a single page source.
+
+    Record the index with `pytest --record-locators`, it is saved to
+    data/locator_index.json when all tests passed. pytest-xdist workers save
+    their recordings to partial files, see `save_partial`/`merge_partials`.
+    """
+
+    def __init__(self) -> None:
+        self.path = INDEX_FILE
+        self.partial_dir = PARTIAL_DIR
+        self.recording = False
+        self.healing = True
+        self.entries: Dict[str, dict] = {}
+        self.healed: Dict[str, Locator] = {}
+        self.heal_seconds = 0.0
+        self.names = locator_names()
+        self._recorded = set()
+
+    def configure(
+        self, path: str = INDEX_FILE, recording: bool = False, healing: bool = True
+    ) -> None:
+        self.path = path
+        self.recording = recording
+        self.healing = healing
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        log.info(f"Saved {len(self.entries)} locators to: {self.path}")
+
+    def save_partial(self, worker: str) -> None:
+        """Save locators recorded by this worker, merged by the controller."""
+        recorded = {
+            name: self.entries[name] for name in self._recorded if name in self.entries
+        }
+        os.makedirs(self.partial_dir, exist_ok=True)
+        path = os.path.join(self.partial_dir, f"index-{worker}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(recorded, f)
+
+    def merge_partials(self) -> None:
+        """Add locators recorded by pytest-xdist workers to the index."""
+        pattern = os.path.join(glob.escape(self.partial_dir), "index-*.json")
+        for path in sorted(glob.glob(pattern)):
+            with open(path, encoding="utf-8") as f:
+                self.entries.update(json.load(f))
+
+    def clear_partials(self) -> None:
+        shutil.rmtree(self.partial_dir, ignore_errors=True)
+
+    def can_heal(self, locator: Locator) -> bool:
+        return self.healing and self.names.get(locator) in self.entries
+
+    def record(self, locator: Locator, driver) -> None:
+        """Record alternatives of a found locator, once per locator and run."""
+        name = self.names.get(locator)
+        if not self.recording or name is None or name in self._recorded:
+            return
+        self._recorded.add(name)
+
+        source = PageSource(driver.page_source)
+        try:
+            nodes = source.find_all(locator)
+        except ValueError:
+            return
+        if nodes:
+            self.entries[name] = {
+                "locator": list(locator),
+                "alternatives": alternatives(source, nodes[0], locator),
+                "recorded": time.strftime("%Y-%m-%d"),
+            }
+
+    def heal(self, locator: Locator, page_source: str) -> Optional[Locator]:
+        """Return the best alternative on the current screen.
+
+        :return: None if there is none or the primary locator is present
+        """
+        start = time.monotonic()
+        name = self.names[locator]
+        entry = self.entries[name]
+        source = PageSource(page_source)
+        try:
+            if source.find_all(locator):
+                return None  # Present but not visible/clickable yet
+        except ValueError:
+            pass
+
+        try:
+            for by, value, _ in entry["alternatives"]:
+                try:
+                    nodes = source.find_all((by, value))
+                except ValueError:
+                    continue
+                if len(nodes) != 1:
+                    continue
+
+                self.healed[name] = (by, value)
+                log.warning(f"Healed locator {name}: {locator} -> {(by, value)}")
+                return by, value
+            return None
+        finally:
+            self.heal_seconds += time.monotonic() - start
+
+    def to_dict(self) -> dict:
+        """Healed locators of this process, sent from pytest-xdist workers."""
+        return {
+            "healed": {name: list(healed) for name, healed in self.healed.items()},
+            "heal_seconds": self.heal_seconds,
+        }
+
+    def merge(self, data: dict) -> None:
+        """Add healed locators of another process."""
+        self.healed.update({name: tuple(h) for name, h in data["healed"].items()})
+        self.heal_seconds += data["heal_seconds"]
+
+    def summary(self) -> List[str]:
+        return [
+            f"{name}: {self.entries[name]['locator']} -> {list(healed)}"
+            for name, healed in self.healed.items()
+        ]
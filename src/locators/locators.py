@@ -14,10 +14,15 @@ class Locators:
         GALLERY_LINK = (AppiumBy.ACCESSIBILITY_ID, "Gallery")
         IMAGE_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "ImageButton")
         TABS_LINK = (AppiumBy.ACCESSIBILITY_ID, "Tabs")
+        PROGRESS_BAR_LINK = (AppiumBy.ACCESSIBILITY_ID, "Progress Bar")
 
         class text_fields:
             HINT_INPUT = (AppiumBy.ID, "io.appium.android.apis:id/edit")
 
+        class progress_bar:
+            SMALLER_LINK = (AppiumBy.ACCESSIBILITY_ID, "2. Smaller")
+            SPINNER = (AppiumBy.CLASS_NAME, "android.widget.ProgressBar")
+
         class tabs_fields:
             SCROLLABLE_LINK = (AppiumBy.ACCESSIBILITY_ID, "5. Scrollable")
             SCROLLABLE_TAB = (
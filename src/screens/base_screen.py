@@ -1,9 +1,13 @@
+import shlex
 import time
-from typing import Tuple, Literal
+from typing import Dict, Optional, Tuple, Literal
 
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver import ActionChains
 
+from drivers.session_health import SessionDeadError
 from screens.element_interactor import ElementInteractor
+from screens.page_source import PageSource
 from utils.logger import log
 
 
@@ -20,6 +24,7 @@ class Screen(ElementInteractor):
         """Click on element"""
         element = self.element(locator, condition=condition)
         element.click()
+        self._mutated()
 
     def tap(self, locator: Locator, duration: float = 500, **kwargs):
         """Taps on an element using ActionHelpers.
@@ -35,7 +40,13 @@ class Screen(ElementInteractor):
             x = location["x"] + size["width"] // 2
             y = location["y"] + size["height"] // 2
             self.driver.tap([(x, y)], duration=duration)
+            self._mutated()
+        except SessionDeadError:
+            raise
         except Exception as e:
+            self.health.guard(e)
+            if self.step_depth:
+                raise  # Retried by the step
             print(f"Error during tap action: {e}")
 
     def swipe(
@@ -64,6 +75,7 @@ class Screen(ElementInteractor):
         )
 
         self.driver.swipe(start_x, start_y, end_x, end_y, duration=duration_ms)
+        self._mutated(scrolled=True)
 
     def swipe_to_delete(
         self,
@@ -94,6 +106,7 @@ class Screen(ElementInteractor):
         start_y = location["y"] + size["height"] // 2
 
         self.driver.swipe(start_x, start_y, end_x, start_y, duration_ms)
+        self._mutated(scrolled=True)
 
     def scroll(
         self,
@@ -143,6 +156,7 @@ class Screen(ElementInteractor):
         to_element = self.element(destination_el)
 
         self.driver.scroll(to_element, from_element, duration=duration)
+        self._mutated(scrolled=True)
 
     def scroll_until_element_visible(
         self,
@@ -161,6 +175,107 @@ class Screen(ElementInteractor):
         element = self.element(locator)
         element.clear()
         element.send_keys(text)
+        self._mutated()
+
+    def fill_form(
+        self,
+        fields: Dict[Locator, str],
+        verify: bool = False,
+        hide_keyboard: bool = True,
+        adb_ime_min_length: Optional[int] = None,
+    ):
+        """Fills several text fields at once.
+
+        Waits for the form once and resolves all fields without further waits.
+        Android values are replaced with `mobile: replaceElementValue`, which
+        does not open the soft keyboard, iOS values are set with XCUITest setValue.
+
+        :param fields: {locator: value} in the order the fields are filled
+        :param verify: check all values afterward with one page source read
+        :param hide_keyboard: hide the soft keyboard once at the end
+        :param adb_ime_min_length: Android only, type values of at least this
+            length with an ADB_INPUT_TEXT broadcast, requires ADBKeyBoard IME
+            and the adb_shell insecure feature of the Appium server
+
+        **Usage Example:**
+
+         screen.fill_form({LOGIN_INPUT: "user", PASSWORD_INPUT: "secret"})
+        """
+        if not fields:
+            return
+
+        self.wait_for(next(iter(fields)), condition="present")
+        elements = {locator: self._resolve(locator) for locator in fields}
+
+        for locator, value in fields.items():
+            self._set_value(elements[locator], value, adb_ime_min_length)
+
+        if hide_keyboard and self.driver.is_keyboard_shown():
+            self.driver.hide_keyboard()
+        self._mutated()
+
+        if verify:
+            self._verify_form(fields, elements)
+
+    def _verify_form(self, fields: Dict[Locator, str], elements: dict):
+        """Compare field values with one page source read.
+
+        iOS text fields keep the text in `value`, `label` is the accessibility
+        label. XPaths the page source parser can not evaluate (without lxml)
+        are read from the element.
+        """
+        ios = self.session_settings.platform == "ios"
+        attr = "value" if ios else "text"
+        source = PageSource(self.driver.page_source)
+        mismatches = {}
+        for locator, value in fields.items():
+            try:
+                rows = source.records(locator, [attr])
+                actual = rows[0][attr] if rows else None
+            except ValueError:
+                element = elements[locator]
+                actual = element.get_attribute("value") if ios else element.text
+            if actual != value:
+                mismatches[locator] = actual
+        if mismatches:
+            raise AssertionError(f"Form fields were not filled: {mismatches}")
+
+    def _resolve(self, locator: Locator):
+        """Find an element without waiting, waits only if it is not there yet."""
+        if self.cache is not None:
+            cached = self.cache.get(locator)
+            if cached is not None:
+                return cached
+        try:
+            return self.driver.find_element(*locator)
+        except NoSuchElementException:
+            return self.element(locator, condition="present")
+
+    def _set_value(self, element, value: str, adb_ime_min_length: Optional[int]):
+        if self.session_settings.platform == "ios":
+            element.clear()
+            element.send_keys(value)
+        elif adb_ime_min_length is not None and len(value) >= adb_ime_min_length:
+            element.clear()
+            element.click()  # ADB_INPUT_TEXT types into the focused field
+            self.driver.execute_script(
+                "mobile: shell",
+                {
+                    "command": "am",
+                    "args": [
+                        "broadcast",
+                        "-a",
+                        "ADB_INPUT_TEXT",
+                        "--es",
+                        "msg",
+                        shlex.quote(value),
+                    ],
+                },
+            )
+        else:
+            self.driver.execute_script(
+                "mobile: replaceElementValue", {"elementId": element.id, "text": value}
+            )
 
     def double_tap(
         self, locator: Locator, condition: Condition = "clickable", **kwargs
@@ -168,7 +283,12 @@ class Screen(ElementInteractor):
         """Double taps on an element."""
         try:
             self.double_tap_actions(locator, condition=condition, **kwargs)
+        except SessionDeadError:
+            raise
         except Exception as e:
+            self.health.guard(e)
+            if self.step_depth:
+                raise  # Retried by the step
             print(f"Error during double tap action: {e}")
 
     @staticmethod
@@ -183,12 +303,24 @@ class Screen(ElementInteractor):
 
     def back(self):
         self.driver.back()
+        self._mutated(navigated=True)
 
     def close(self):
         self.driver.close_app()
+        self._mutated(navigated=True)
 
     def reset(self):
         self.driver.reset()
+        self._mutated(navigated=True)
 
     def launch_app(self):
         self.driver.launch_app()
+        self._mutated(navigated=True)
+
+    def restart_app(self):
+        """Terminate and activate the app under test, it starts on its launch screen."""
+        caps = self.driver.capabilities
+        app_id = caps.get("appPackage") or caps.get("bundleId")
+        self.driver.terminate_app(app_id)
+        self.driver.activate_app(app_id)
+        self._mutated(navigated=True)
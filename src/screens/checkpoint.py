@@ -0,0 +1,127 @@
+import functools
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Union
+
+from selenium.common.exceptions import WebDriverException
+
+from drivers.session_health import SessionDeadError, SessionHealth
+from utils.logger import Logger, LogLevel, Singleton
+from utils.logger import log as log_method
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+
+class StepStats(metaclass=Singleton):
+    """Retried steps of the run and time saved compared with full reruns."""
+
+    def __init__(self) -> None:
+        self.test: Optional[str] = None
+        self.test_started = time.monotonic()
+        self.retries: List[dict] = []
+
+    def begin_test(self, test: str) -> None:
+        self.test = test
+        self.test_started = time.monotonic()
+
+    def record(self, step: str, attempt: int, failed_at: float, restore: float):
+        """A full rerun repeats everything before the failure, including setup."""
+        self.retries.append(
+            {
+                "test": self.test,
+                "step": step,
+                "attempt": attempt,
+                "saved_seconds": max(0.0, failed_at - self.test_started - restore),
+            }
+        )
+
+    def to_dict(self) -> dict:
+        """Retries of this process, sent from pytest-xdist workers."""
+        return {"retries": self.retries}
+
+    def merge(self, data: dict) -> None:
+        """Add retries of another process."""
+        self.retries.extend(data["retries"])
+
+    def summary(self) -> str:
+        saved = sum(retry["saved_seconds"] for retry in self.retries)
+        steps = ", ".join(sorted({retry["step"] for retry in self.retries}))
+        return (
+            f"Retried steps: {len(self.retries)} ({steps}), "
+            f"saved vs full reruns: {saved / 60:.1f} minutes"
+        )
+
+
+def is_transient(error: BaseException) -> bool:
+    """Driver errors worth retrying, a dead session is not."""
+    if isinstance(error, SessionDeadError) or SessionHealth().is_open:
+        return False
+    return isinstance(error, WebDriverException) and not SessionHealth.is_fatal(error)
+
+
+@contextmanager
+def _in_step(screen):
+    """Lenient actions (tap) raise while a step runs, so it can be retried."""
+    screen.step_depth = getattr(screen, "step_depth", 0) + 1
+    try:
+        yield
+    finally:
+        screen.step_depth -= 1
+
+
+def step(
+    precondition: Optional[Union[str, Callable]] = None,
+    attempts: int = 2,
+    data: Optional[str] = None,
+) -> Callable:
+    """Decorator to log a Screen method and retry it from its checkpoint.
+
+    On a transient driver error the precondition restores the screen the
+    step starts on and only the step is retried, not the whole test.
+    Inside a step `Screen.tap` and `double_tap` raise errors instead of
+    printing them.
+
+    :param precondition: Screen method (or its name) restoring the checkpoint
+        screen of the step, e.g. by navigating to it. Without it the step
+        is not retried.
+    :param attempts: Number of attempts of the step.
+    :param data: Custom log message to use if no docstring is provided.
+
+    **Usage Example:**
+
+     @step(precondition="ensure_scrollable_tabs")
+     def swipe_scrollable_tab(self):
+         \"\"\"Swipe Scrollable tabs left\"\"\"
+    """
+
+    def decorator(func: Callable) -> Callable:
+        logged = log_method(data)(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    with _in_step(self):
+                        return logged(self, *args, **kwargs)
+                except Exception as e:
+                    if precondition is None or attempt == attempts:
+                        raise
+                    if not is_transient(e):
+                        raise  # Test failures and dead sessions are not retried
+
+                    failed_at = time.monotonic()
+                    name = f"{type(self).__name__}.{func.__name__}"
+                    log.warning(f"Step {name} failed ({e}), retrying from checkpoint")
+                    restore = (
+                        getattr(self, precondition)
+                        if isinstance(precondition, str)
+                        else functools.partial(precondition, self)
+                    )
+                    restore()
+                    StepStats().record(
+                        name, attempt + 1, failed_at, time.monotonic() - failed_at
+                    )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,109 @@
+import weakref
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.remote.webelement import WebElement
+
+from utils.logger import Singleton
+
+Locator = Tuple[str, str]
+
+
+class CacheStats(metaclass=Singleton):
+    """Hit/miss counters of all element caches of the run."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    def to_dict(self) -> dict:
+        """Counters of this process, sent from pytest-xdist workers."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+        }
+
+    def merge(self, data: dict) -> None:
+        """Add counters of another process."""
+        for key, value in data.items():
+            setattr(self, key, getattr(self, key) + value)
+
+    def summary(self) -> str:
+        lookups = self.hits + self.misses
+        ratio = self.hits / lookups * 100 if lookups else 0
+        return (
+            f"Element cache: {self.hits} hits, {self.misses} misses "
+            f"({ratio:.0f}% hit rate), {self.stale} stale, "
+            f"{self.evictions} evicted"
+        )
+
+
+class ElementCache:
+    """LRU cache of resolved `WebElement` handles of one screen, keyed by locator.
+
+    Handles are validated with a cheap rect (and enabled for clickable) call
+    before reuse, stale handles are evicted. Mutating actions on other screens
+    clear the cache, see `invalidate_others`.
+    """
+
+    _caches = weakref.WeakSet()
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._elements: OrderedDict[Locator, WebElement] = OrderedDict()
+        ElementCache._caches.add(self)
+
+    def get(self, locator: Locator, condition: str = "visible") -> Optional[WebElement]:
+        """Return the cached handle of `locator` if it is still valid."""
+        element = self._elements.get(locator)
+        if element is None:
+            self.stats.misses += 1
+            return None
+
+        try:
+            rect = element.rect
+            valid = rect["width"] > 0 and rect["height"] > 0
+            if valid and condition == "clickable":
+                valid = element.is_enabled()
+        except (StaleElementReferenceException, NoSuchElementException):
+            self.stats.stale += 1
+            valid = False
+
+        if not valid:
+            self.evict(locator)
+            self.stats.misses += 1
+            return None
+
+        self._elements.move_to_end(locator)
+        self.stats.hits += 1
+        return element
+
+    def put(self, locator: Locator, element: WebElement) -> None:
+        self._elements[locator] = element
+        self._elements.move_to_end(locator)
+        while len(self._elements) > self.max_size:
+            self._elements.popitem(last=False)
+            self.stats.evictions += 1
+
+    def evict(self, locator: Locator) -> None:
+        self._elements.pop(locator, None)
+
+    def clear(self) -> None:
+        self.stats.evictions += len(self._elements)
+        self._elements.clear()
+
+    @classmethod
+    def invalidate_others(cls, cache: Optional["ElementCache"] = None) -> None:
+        """Clear every cache except `cache`, or all caches if it is None."""
+        for other in list(cls._caches):
+            if other is not cache:
+                other.clear()
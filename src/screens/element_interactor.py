@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Tuple, Optional, Literal, List, cast
+from typing import Tuple, Optional, Literal, List, Sequence, Iterator, cast
 import time
 
 from selenium.webdriver import ActionChains
@@ -11,6 +11,12 @@ from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from drivers.session_health import SessionDeadError, SessionHealth
+from locators.fallback_index import FallbackIndex
+from screens.element_cache import ElementCache
+from screens.page_source import PageSource, Record
+from screens.settings_profile import SettingsManager, SettingsProfile
+
 Locator = Tuple[str, str]
 type Condition = Literal["clickable", "visible", "present"]
 
@@ -24,6 +30,14 @@ class WaitType(Enum):
 
 
 class ElementInteractor:
+    # Opt-in cache of resolved element handles, enable it on Screen subclasses
+    cache_elements: bool = False
+    cache_size: int = 32
+    # Appium session settings applied while this screen looks up elements
+    settings_profile: Optional[SettingsProfile] = None
+    # Number of running checkpoint steps, see screens.checkpoint.step
+    step_depth: int = 0
+
     def __init__(self, driver):
         self.driver = driver
         self.waiters = {
@@ -34,11 +48,38 @@ class ElementInteractor:
         self.waiters[WaitType.FLUENT] = WebDriverWait(
             driver, WaitType.FLUENT.value, poll_frequency=1
         )
+        self.health = SessionHealth()
+        self.cache = ElementCache(self.cache_size) if self.cache_elements else None
+        self.session_settings = SettingsManager.for_driver(driver)
+        self.fallback = FallbackIndex()
 
     def _get_waiter(self, wait_type: Optional[WaitType] = None) -> WebDriverWait:
         """Returns the appropriate waiter based on the given wait_type."""
         return self.waiters.get(wait_type, self.waiters[WaitType.DEFAULT])
 
+    def _timeout(self, wait_type: Optional[WaitType] = None) -> float:
+        return self._get_waiter(wait_type)._timeout
+
+    def using_settings(self, profile: SettingsProfile):
+        """Applies a settings profile to a block of calls.
+
+        **Usage Example:**
+
+         with screen.using_settings(Profiles.ANIMATED):
+             screen.tap(Locators.views_menu.ANIMATION_LINK)
+        """
+        return self.session_settings.override(profile, self.settings_profile)
+
+    def _mutated(self, navigated: bool = False, scrolled: bool = False) -> None:
+        """Invalidate element caches after a mutating action.
+
+        :param navigated: the action may change this screen too (back, relaunch)
+        :param scrolled: the content of this screen moved (scroll, swipe), list
+            rows are recycled and cached handles may show other content
+        """
+        own = navigated or scrolled
+        ElementCache.invalidate_others(None if own else self.cache)
+
     def wait_for(
         self,
         locator: Locator,
@@ -46,6 +87,7 @@ class ElementInteractor:
         waiter: Optional[WebDriverWait] = None,
     ) -> WebElement:
         waiter = waiter or self._get_waiter()
+        self.session_settings.use(self.settings_profile)
         conditions = {
             "clickable": ec.element_to_be_clickable(locator),
             "visible": ec.visibility_of_element_located(locator),
@@ -66,18 +108,89 @@ class ElementInteractor:
         n: int = 3,
         condition: Condition = "visible",
         wait_type: Optional[WaitType] = WaitType.DEFAULT,
+        heal: bool = True,
     ):
+        """Finds an element, waiting for the condition up to n times.
+
+        :param heal: try alternatives from the locator fallback index when the
+            primary locator misses on a quick probe
+        """
+        if self.cache is not None:
+            cached = self.cache.get(locator, condition)
+            if cached is not None:
+                return cached
+
+        self.health.check()
+        if heal and self.fallback.can_heal(locator):
+            element = self._find_or_heal(locator, n, condition, wait_type)
+        else:
+            element = self._find(locator, n, condition, wait_type)
+
+        if self.cache is not None:
+            self.cache.put(locator, element)
+        return element
+
+    def _find(
+        self,
+        locator: Locator,
+        n: int,
+        condition: Condition,
+        wait_type: Optional[WaitType],
+        timeout: Optional[float] = None,
+    ) -> WebElement:
+        """:param timeout: wait this long instead of the `wait_type` timeout"""
+        waiter = self._get_waiter(wait_type)
+        if timeout is not None:
+            waiter = WebDriverWait(self.driver, timeout, poll_frequency=waiter._poll)
         for attempt in range(1, n + 1):
             try:
-                self.wait_for(
-                    locator, condition=condition, waiter=self._get_waiter(wait_type)
-                )
-                return self.driver.find_element(*locator)
+                self.wait_for(locator, condition=condition, waiter=waiter)
+                element = self.driver.find_element(*locator)
+                self.fallback.record(locator, self.driver)
+                return element
             except NoSuchElementException:
                 if attempt == n:
                     raise NoSuchElementException(
                         f"Could not locate element with value: {locator}"
                     )
+            except Exception as e:
+                self.health.guard(e)
+                raise
+
+    def _find_or_heal(
+        self,
+        locator: Locator,
+        n: int,
+        condition: Condition,
+        wait_type: Optional[WaitType],
+    ) -> WebElement:
+        """Quick probe of the primary locator, then ranked alternatives.
+
+        A drifted locator is healed from one page source instead of n full waits.
+        Without a matching alternative (e.g. the screen is still loading) the
+        primary locator is waited for the rest of the `wait_type` timeout, a
+        missing element fails no later than without healing.
+        """
+        start = time.monotonic()
+        try:
+            return self._find(locator, 1, condition, WaitType.SHORTEST)
+        except (NoSuchElementException, TimeoutException):
+            pass
+
+        try:
+            healed = self.fallback.heal(locator, self.driver.page_source)
+            if healed is not None:
+                return self.wait_for(
+                    healed, condition, self._get_waiter(WaitType.SHORTEST)
+                )
+        except (NoSuchElementException, TimeoutException):
+            pass
+        except Exception as e:
+            self.health.guard(e)
+            raise
+
+        remaining = self._timeout(wait_type) - (time.monotonic() - start)
+        return self._find(locator, n, condition, wait_type, max(0.0, remaining))
 
     def elements(
         self,
@@ -86,6 +199,7 @@ class ElementInteractor:
         condition: Condition = "visible",
         wait_type: Optional[WaitType] = WaitType.DEFAULT,
     ) -> List[WebElement]:
+        self.health.check()
         for attempt in range(1, n + 1):
             try:
                 self.wait_for(
@@ -97,6 +211,42 @@ class ElementInteractor:
                     raise NoSuchElementException(
                         f"Could not locate element list with value: {locator}"
                     )
+            except Exception as e:
+                self.health.guard(e)
+                raise
+
+    def elements_data(
+        self,
+        locator: Locator,
+        attrs: Sequence[str] = ("text",),
+        condition: Condition = "present",
+        wait_type: Optional[WaitType] = WaitType.DEFAULT,
+    ) -> List[Record]:
+        """Reads attributes of all elements matching the locator in one round trip.
+
+        Uses a single page source request instead of one request per element
+        per attribute, e.g. 50 rows x 3 attributes = 150 requests vs 1.
+
+        :param locator: The locator tuple (strategy, value) of the collection.
+        :param attrs: Attributes to read, e.g. ["text", "displayed", "bounds"].
+        :param condition: Condition of the first element to wait for.
+        :param wait_type: Specifies the wait strategy.
+        :return: One dict of attribute values per element, in document order.
+
+        **Usage Example:**
+
+         screen.elements_data(Locators.main_menu.MENU_ELEMENTS, ["text"])
+        [{'text': 'API Demos'}, {'text': 'Access'}, ...]
+        """
+        self.health.check()
+        self.wait_for(locator, condition=condition, waiter=self._get_waiter(wait_type))
+        return PageSource(self.driver.page_source).records(locator, attrs)
+
+    def iter_elements_data(
+        self, locator: Locator, attrs: Sequence[str] = ("text",)
+    ) -> Iterator[Record]:
+        """Streaming version of `elements_data` for very large lists, does not wait."""
+        return PageSource.iter_records(self.driver.page_source, locator, attrs)
 
     def is_displayed(
         self,
@@ -107,15 +257,19 @@ class ElementInteractor:
         wait_type: Optional[WaitType] = None,
     ) -> None:
         wait_type = wait_type or WaitType.DEFAULT
-        for _ in range(n):
+        retry_delay = 0.5
+        # A dead session fails each attempt at once, only the delays are skipped
+        self.health.check(saved_seconds=n * retry_delay)
+        for attempt in range(1, n + 1):
             try:
                 element = self.wait_for(
                     locator, condition=condition, waiter=self._get_waiter(wait_type)
                 )
                 assert element.is_displayed() == expected
                 return
-            except Exception:
-                time.sleep(0.5)
+            except Exception as e:
+                self.health.guard(e, (n - attempt + 1) * retry_delay)
+                time.sleep(retry_delay)
         if expected:  # Assert if the element is expected to be displayed but isn't
             raise AssertionError(f"Element {locator} was not displayed as expected.")
         else:  # Assert if the element should not be displayed but is
@@ -156,16 +310,22 @@ class ElementInteractor:
          screen.is_exist(("id", "error-popup"), expected=False)
         True
         """
-        for _ in range(n):
+        # A dead session fails each attempt at once, only the delays are skipped
+        self.health.check(saved_seconds=n * retry_delay)
+        for attempt in range(1, n + 1):
             try:
                 element = self.element(
-                    locator, n=1, condition=condition, wait_type=wait_type
+                    locator, n=1, condition=condition, wait_type=wait_type, heal=False
                 )
                 return element.is_displayed() == expected
             except (NoSuchElementException, TimeoutException):
                 if not expected:
                     return True
+            except SessionDeadError:
+                self.health.saved_seconds += (n - attempt + 1) * retry_delay
+                raise
             except Exception as e:
+                self.health.guard(e, (n - attempt + 1) * retry_delay)
                 print(f"Unexpected error in is_exist: {e}")
             time.sleep(retry_delay)
         return not expected
@@ -204,6 +364,7 @@ class ElementInteractor:
         actions.w3c_actions.pointer_action.release()
 
         actions.perform()
+        self._mutated(scrolled=True)
 
     def double_tap_actions(
         self,
@@ -234,3 +395,4 @@ class ElementInteractor:
 
         actions = ActionChains(self.driver)
         actions.double_click(element).perform()
+        self._mutated()
@@ -2,6 +2,7 @@ from typing import Literal
 
 from locators.locators import Locators
 from screens.base_screen import Screen
+from screens.checkpoint import step
 from utils.logger import log
 
 
@@ -38,28 +39,84 @@ class MainScreen(Screen):
             destination_el=self.locators.views_menu.TEXT_FIELDS
         )
 
-    def swipe_tab(self):
-        """Move to Scrollable tab and swipe left"""
+    def ensure_main_menu(self):
+        """Checkpoint: main menu"""
+        if not self.is_exist(self.locators.main_menu.VIEWS_LINK, n=1):
+            self.restart_app()
+
+    def ensure_views(self):
+        """Checkpoint: Views list"""
+        views = self.locators.views_menu
+        if not (
+            self.is_exist(views.ANIMATION_LINK, n=1)
+            or self.is_exist(views.TABS_LINK, n=1)
+        ):
+            self.restart_app()
+            self.open_views()
+
+    def ensure_scrollable_tabs(self):
+        """Checkpoint: Views > Tabs > 5. Scrollable"""
+        if not self.is_exist(self.locators.views_menu.tabs_fields.SCROLLABLE_TAB, n=1):
+            self.restart_app()
+            self.open_views()
+            self.open_scrollable_tabs()
+
+    @step(precondition="ensure_main_menu")
+    def open_views(self):
+        """Open Views"""
         self.tap(locator=self.locators.main_menu.VIEWS_LINK)
+
+    @step(precondition="ensure_views")
+    def open_scrollable_tabs(self):
+        """Open Views > Tabs > 5. Scrollable"""
         self.scroll_until_element_visible(
             destination_el=self.locators.views_menu.TABS_LINK
         )
         self.tap(locator=self.locators.views_menu.TABS_LINK)
         self.tap(locator=self.locators.views_menu.tabs_fields.SCROLLABLE_LINK)
+
+    @step(precondition="ensure_scrollable_tabs")
+    def swipe_scrollable_tab(self):
+        """Swipe Scrollable tabs left"""
         self.swipe_to_delete(
             locator=self.locators.views_menu.tabs_fields.SCROLLABLE_TAB,
             direction="left",
         )
 
-    def type_text(self, text):
-        """Type text to field with HINT"""
+    def swipe_tab(self):
+        """Move to Scrollable tab and swipe left"""
+        self.open_views()
+        self.open_scrollable_tabs()
+        self.swipe_scrollable_tab()
+
+    def open_text_fields(self):
+        """Open Views > TextFields"""
         self.tap(locator=self.locators.main_menu.VIEWS_LINK)
         self.scroll_until_element_visible(
             destination_el=self.locators.views_menu.TEXT_FIELDS
         )
         self.tap(locator=self.locators.views_menu.TEXT_FIELDS)
-        self.click(locator=self.locators.views_menu.text_fields.HINT_INPUT)
-        self.type(locator=self.locators.views_menu.text_fields.HINT_INPUT, text=text)
+
+    def open_progress_bars(self):
+        """Open Views > Progress Bar > 2. Smaller"""
+        self.tap(locator=self.locators.main_menu.VIEWS_LINK)
+        self.scroll_until_element_visible(
+            destination_el=self.locators.views_menu.PROGRESS_BAR_LINK
+        )
+        self.tap(locator=self.locators.views_menu.PROGRESS_BAR_LINK)
+        self.tap(locator=self.locators.views_menu.progress_bar.SMALLER_LINK)
+
+    def type_text(self, text):
+        """Type text to field with HINT"""
+        self.open_text_fields()
+        self.fill_form({self.locators.views_menu.text_fields.HINT_INPUT: text})
+
+    def menu_items(self):
+        """Texts of all main menu items"""
+        return [
+            item["text"]
+            for item in self.elements_data(self.locators.main_menu.MENU_ELEMENTS)
+        ]
 
     def double_tap_on_views_link(self):
         """Double tap"""
@@ -0,0 +1,142 @@
+import io
+import re
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional, ElementTree supports a subset of XPath
+    etree = None
+
+Locator = Tuple[str, str]
+Record = Dict[str, object]
+
+# Record attribute -> page source attributes (Android first, then iOS)
+ATTRIBUTE_ALIASES = {
+    "text": ("text", "label", "value"),
+    "displayed": ("displayed", "visible"),
+    "content-desc": ("content-desc", "name"),
+    "resource-id": ("resource-id", "name"),
+    "class": ("class", "type"),
+}
+# Page source attributes converted to bool, text attributes stay strings
+BOOLEAN_ATTRIBUTES = {
+    "accessible",
+    "checkable",
+    "checked",
+    "clickable",
+    "displayed",
+    "enabled",
+    "focusable",
+    "focused",
+    "long-clickable",
+    "password",
+    "scrollable",
+    "selected",
+    "visible",
+}
+
+
+def _value(node, attr: str) -> object:
+    if attr == "tag":
+        return node.tag
+    for name in ATTRIBUTE_ALIASES.get(attr, (attr,)):
+        value = node.get(name)
+        if value is None:
+            continue
+        if name in BOOLEAN_ATTRIBUTES:
+            return {"true": True, "false": False}.get(value, value)
+        return value
+    return None
+
+
+def _matcher(locator: Locator) -> Optional[Callable]:
+    """Predicate of a node for simple strategies, None for XPath."""
+    by, value = locator
+    if by == AppiumBy.ID:
+        # UiAutomator2 prefixes ids without a package with the app package
+        if ":id/" in value:
+            return lambda node: value in (node.get("resource-id"), node.get("name"))
+        suffix = f":id/{value}"
+        return lambda node: node.get("name") == value or (
+            node.get("resource-id") or ""
+        ).endswith(suffix)
+    if by == AppiumBy.ACCESSIBILITY_ID:
+        return lambda node: value in (node.get("content-desc"), node.get("name"))
+    if by == AppiumBy.CLASS_NAME:
+        return lambda node: node.tag == value
+    if by == AppiumBy.XPATH:
+        return None
+    raise ValueError(f"Unsupported locator strategy for page source: {by}")
+
+
+def records(nodes, attrs: Sequence[str]) -> List[Record]:
+    return [{attr: _value(node, attr) for attr in attrs} for node in nodes]
+
+
+class PageSource:
+    """Parsed page source, one round trip for a whole element collection.
+
+    **Usage Example:**
+
+     source = PageSource(driver.page_source)
+     source.records(Locators.main_menu.MENU_ELEMENTS, ["text", "displayed"])
+    [{'text': 'API Demos', 'displayed': True}, ...]
+    """
+
+    def __init__(self, xml: str):
+        self.xml = xml
+        if etree is not None:
+            self.root = etree.fromstring(xml.encode())
+        else:
+            self.root = ET.fromstring(xml)
+
+    def find_all(self, locator: Locator) -> list:
+        """Nodes matching the locator, in document order."""
+        matcher = _matcher(locator)
+        if matcher is not None:
+            return [node for node in self.root.iter() if matcher(node)]
+
+        xpath = locator[1]
+        if etree is not None:
+            return self.root.xpath(xpath)
+
+        # "(<xpath>)[n]" is not supported by ElementTree
+        indexed = re.fullmatch(r"\((.+)\)\[(\d+)\]", xpath)
+        if indexed:
+            index = int(indexed[2])
+            return self.find_all((AppiumBy.XPATH, indexed[1]))[index - 1 : index]
+        try:
+            return self.root.findall("." + xpath if xpath.startswith("/") else xpath)
+        except SyntaxError as e:
+            raise ValueError(f"XPath {xpath} requires lxml: {e}") from e
+
+    def records(self, locator: Locator, attrs: Sequence[str]) -> List[Record]:
+        return records(self.find_all(locator), attrs)
+
+    @staticmethod
+    def iter_records(
+        xml: str, locator: Locator, attrs: Sequence[str]
+    ) -> Iterator[Record]:
+        """Stream records without building the whole tree, for very large lists.
+
+        XPath locators other than `//<class>` are parsed with `PageSource`.
+        """
+        by, value = locator
+        if by == AppiumBy.XPATH:
+            tag = value[2:]
+            if not value.startswith("//") or any(c in tag for c in "/[]@()*"):
+                yield from PageSource(xml).records(locator, attrs)
+                return
+            matcher = lambda node: node.tag == tag
+        else:
+            matcher = _matcher(locator)
+
+        source = io.BytesIO(xml.encode())
+        for event, node in ET.iterparse(source, events=("start", "end")):
+            if event == "end":
+                node.clear()  # Attributes and children are not needed anymore
+            elif matcher(node):
+                yield {attr: _value(node, attr) for attr in attrs}
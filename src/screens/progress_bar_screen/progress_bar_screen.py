@@ -0,0 +1,17 @@
+from locators.locators import Locators
+from screens.base_screen import Screen
+from screens.settings_profile import Profiles
+
+
+class ProgressBarScreen(Screen):
+    # Spinners never let the app become idle, lookups would wait for idle
+    # up to waitForIdleTimeout (10 s by default) each
+    settings_profile = Profiles.ANIMATED
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.locators = Locators()
+
+    def spinners_count(self):
+        """Count spinning progress bars"""
+        return len(self.elements(self.locators.views_menu.progress_bar.SPINNER))
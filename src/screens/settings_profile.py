@@ -0,0 +1,119 @@
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+
+class SettingsProfile:
+    """Named set of Appium session settings per platform.
+
+    :param name: profile name used in logs
+    :param android: UiAutomator2 settings (timeouts in ms)
+    :param ios: XCUITest settings (timeouts in seconds)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        android: Optional[Dict[str, Any]] = None,
+        ios: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.android = android or {}
+        self.ios = ios or {}
+
+    def for_platform(self, platform: str) -> Dict[str, Any]:
+        return self.ios if platform == "ios" else self.android
+
+    def __repr__(self) -> str:
+        return f"SettingsProfile({self.name})"
+
+
+class Profiles:
+    # Static screens, do not wait for the app to become idle
+    FAST = SettingsProfile(
+        "fast",
+        android={"waitForIdleTimeout": 0, "ignoreUnimportantViews": True},
+        ios={"waitForIdleTimeout": 0, "animationCoolOffTimeout": 0},
+    )
+    # Screens with endless animations, which never become idle
+    ANIMATED = SettingsProfile(
+        "animated",
+        android={"waitForIdleTimeout": 100},
+        ios={"waitForIdleTimeout": 0.1, "animationCoolOffTimeout": 0},
+    )
+    # Long lists, limit the accessibility tree snapshot
+    SHALLOW = SettingsProfile(
+        "shallow",
+        android={"ignoreUnimportantViews": True},
+        ios={"snapshotMaxDepth": 25},
+    )
+
+
+class SettingsManager:
+    """Applies settings profiles to a session through `update_settings`.
+
+    Only changed keys are sent. Keys changed by a profile are restored to
+    their session values when the profile is not active anymore.
+    One manager is shared by all screens of a driver, see `for_driver`.
+    """
+
+    _managers = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.platform = str(
+            (getattr(driver, "capabilities", None) or {}).get("platformName", "android")
+        ).lower()
+        self._current: Optional[Dict[str, Any]] = None
+        self._original: Dict[str, Any] = {}
+        self._overrides: List[SettingsProfile] = []
+
+    @classmethod
+    def for_driver(cls, driver) -> "SettingsManager":
+        if driver not in cls._managers:
+            cls._managers[driver] = cls(driver)
+        return cls._managers[driver]
+
+    def _apply(self, target: Dict[str, Any]) -> None:
+        if self._current is None:
+            self._current = dict(self.driver.get_settings())
+
+        changed = {k: v for k, v in target.items() if self._current.get(k) != v}
+        if not changed:
+            return
+
+        for key in changed:
+            self._original.setdefault(key, self._current.get(key))
+        self.driver.update_settings(changed)
+        self._current.update(changed)
+        log.info(f"Updated session settings: {changed}")
+
+    def use(self, profile: Optional[SettingsProfile] = None) -> None:
+        """Make `profile` (or the innermost `override`) the active profile.
+
+        Cheap when nothing changes, no request is sent.
+        """
+        if profile is None and not self._overrides and not self._original:
+            return
+
+        target = {k: v for k, v in self._original.items() if v is not None}
+        if profile is not None:
+            target.update(profile.for_platform(self.platform))
+        if self._overrides:
+            target.update(self._overrides[-1].for_platform(self.platform))
+        self._apply(target)
+
+    @contextmanager
+    def override(self, profile: SettingsProfile, screen_profile=None):
+        """Apply `profile` for a block of calls, restores settings on exit."""
+        self._overrides.append(profile)
+        try:
+            self.use(screen_profile)
+            yield
+        finally:
+            self._overrides.pop()
+            self.use(screen_profile)
@@ -0,0 +1,149 @@
+"""Merge per-worker log shards into one time-ordered log and slice it by test id.
+
+Usage:
+    python -m utils.log_merge merge [--date 2025-01-01] [--dir reports/logs]
+    python -m utils.log_merge filter test_actions.py::TestBaseActions::test_tap
+"""
+
+import argparse
+import glob
+import gzip
+import heapq
+import os
+import re
+import sys
+import time
+from typing import Iterator, List, Optional, TextIO
+
+from utils.logger import log_segments
+
+LOG_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../..", "reports/logs")
+)
+# "2025-01-01 12:00:00,123 - ", sorts lexicographically in time order
+TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} ")
+CONTEXT = re.compile(r" - \[([^\]]*)\] \[([^\]]*)\] - ")
+
+
+def _open(path: str) -> TextIO:
+    if not path.endswith(".gz") and not os.path.exists(path):
+        path = f"{path}.gz"  # Compressed after the segments were listed
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, encoding="utf-8", errors="replace")
+
+
+def read_records(paths: List[str]) -> Iterator[str]:
+    """Stream log records of files, multi-line records (tracebacks) are kept whole."""
+    record = ""
+    for path in paths:
+        with _open(path) as f:
+            for line in f:
+                if TIMESTAMP.match(line) and record:
+                    yield record
+                    record = ""
+                record += line
+    if record:
+        yield record
+
+
+def shard_records(log_file: str) -> Iterator[str]:
+    """Records of a worker shard, rotated segments first."""
+    paths = log_segments(log_file)
+    if os.path.exists(log_file):
+        paths.append(log_file)
+    return read_records(paths)
+
+
+def shards(log_dir: str = LOG_DIR, date: Optional[str] = None) -> List[str]:
+    date = date or time.strftime("%Y-%m-%d")
+    return sorted(glob.glob(os.path.join(glob.escape(log_dir), f"log_{date}_*.log")))
+
+
+def remove_stale_shards(
+    keep: str, log_dir: str = LOG_DIR, date: Optional[str] = None
+) -> None:
+    """Remove shards and the merged log of earlier runs of the day.
+
+    E.g. gw3 of an earlier `-n 4` run would be merged into a `-n 2` run log.
+
+    :param keep: shard of the current process, already written to
+    """
+    date = date or time.strftime("%Y-%m-%d")
+    merged = os.path.join(log_dir, f"log_{date}.log")
+    if os.path.exists(merged):
+        os.remove(merged)
+    for log_file in shards(log_dir, date):
+        if os.path.abspath(log_file) == os.path.abspath(keep):
+            continue
+        for path in [log_file, *log_segments(log_file)]:
+            os.remove(path)
+
+
+def merged_log(log_dir: str = LOG_DIR, date: Optional[str] = None) -> str:
+    """Merged log of the day, the single shard of a run without pytest-xdist."""
+    date = date or time.strftime("%Y-%m-%d")
+    merged = os.path.join(log_dir, f"log_{date}.log")
+    log_files = shards(log_dir, date)
+    if not os.path.exists(merged) and len(log_files) == 1:
+        return log_files[0]
+    return merged
+
+
+def merge_logs(log_files: List[str], output: str) -> int:
+    """K-way merge of time-ordered shards, only one record per shard is in memory.
+
+    :return: number of merged records
+    """
+    streams = [shard_records(log_file) for log_file in log_files]
+    count = 0
+    with open(output, "w", encoding="utf-8") as out:
+        for record in heapq.merge(*streams, key=lambda r: r[:23]):
+            out.write(record)
+            count += 1
+    return count
+
+
+def filter_log(path: str, test_id: str, out: TextIO) -> int:
+    """Write records of a log and its segments whose test id contains `test_id`.
+
+    :return: number of matching records
+    """
+    count = 0
+    for record in shard_records(path):
+        context = CONTEXT.search(record, 0, record.find("\n"))
+        if context and test_id in context[2]:
+            out.write(record)
+            count += 1
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m utils.log_merge")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    merge = commands.add_parser("merge", help="Merge worker shards of a day")
+    merge.add_argument("--dir", default=LOG_DIR, help="Log directory")
+    merge.add_argument("--date", help="Date of the logs, today by default")
+    merge.add_argument("-o", "--output", help="Merged log, log_<date>.log by default")
+
+    slice_ = commands.add_parser("filter", help="Print records of a test")
+    slice_.add_argument("test_id", help="Test id or its part, e.g. test_tap")
+    slice_.add_argument(
+        "log", nargs="?", help="Log file, today's merged log by default"
+    )
+
+    args = parser.parse_args(argv)
+    date = getattr(args, "date", None) or time.strftime("%Y-%m-%d")
+
+    if args.command == "merge":
+        output = args.output or os.path.join(args.dir, f"log_{date}.log")
+        count = merge_logs(shards(args.dir, date), output)
+        print(f"Merged {count} records into {output}")
+    else:
+        path = args.log or merged_log(LOG_DIR, date)
+        filter_log(path, args.test_id, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,21 @@
+import atexit
+import glob
+import gzip
 import logging
 import os
+import queue
+import re
+import shutil
+import threading
 import time
 from enum import Enum
+from logging.handlers import RotatingFileHandler
 from typing import Optional, Callable, Any, Literal
 
+LOG_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - [%(worker)s] [%(test_id)s] - %(message)s"
+)
+
 
 class LogLevel(Enum):
     DEBUG = logging.DEBUG
@@ -21,6 +33,118 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+def worker_id() -> str:
+    """pytest-xdist worker id (gw0, gw1, ...) or "main" without xdist."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+class ContextFilter(logging.Filter):
+    """Adds the worker id and the current pytest test id to log records."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.worker = worker_id()
+        # "tests/test_p1/test_actions.py::TestBaseActions::test_tap (call)"
+        current_test = os.environ.get("PYTEST_CURRENT_TEST", "-")
+        record.test_id = current_test.rsplit(" ", 1)[0]
+        return True
+
+
+def _segments(log_file: str) -> list:
+    segments = []
+    for path in glob.glob(f"{glob.escape(log_file)}.*"):
+        match = re.fullmatch(r"\.(\d+)(\.gz)?", path[len(log_file) :])
+        if match:
+            segments.append((int(match[1]), path))
+    return sorted(segments)
+
+
+def log_segments(log_file: str) -> list:
+    """Rotated segments of `log_file`, oldest first."""
+    return [path for _, path in _segments(log_file)]
+
+
+class SegmentCompressor:
+    """Gzips rotated log segments on a background thread."""
+
+    def __init__(self, backup_count: int):
+        self.backup_count = backup_count
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="log-compressor", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self._queue.join)
+
+    def submit(self, segment: str) -> None:
+        self._queue.put(segment)
+
+    def join(self) -> None:
+        """Wait until all submitted segments are compressed."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            segment = self._queue.get()
+            try:
+                with open(segment, "rb") as src:
+                    with gzip.open(f"{segment}.tmp", "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+                os.replace(f"{segment}.tmp", f"{segment}.gz")
+                os.remove(segment)
+                self._prune(segment)
+            except OSError:
+                pass  # The raw segment is kept, the merger reads it too
+            finally:
+                self._queue.task_done()
+
+    def _prune(self, segment: str) -> None:
+        base = segment.rsplit(".", 1)[0]
+        for old in log_segments(base)[: -self.backup_count or None]:
+            os.remove(old)
+
+
+class ShardFileHandler(RotatingFileHandler):
+    """Size-rotated log file of one worker.
+
+    Rotation renames the file to `<log>.<n>` (increasing, oldest first) and
+    compresses it to `<log>.<n>.gz` in the background, at most `backup_count`
+    segments are kept.
+    """
+
+    def __init__(
+        self, filename: str, mode: str, max_bytes: int, backup_count: int
+    ) -> None:
+        if mode == "w":
+            # RotatingFileHandler always appends, overwrite the shard explicitly
+            for old in [filename, *log_segments(filename)]:
+                if os.path.exists(old):
+                    os.remove(old)
+        super().__init__(
+            filename, mode="a", maxBytes=max_bytes, backupCount=backup_count
+        )
+        segments = _segments(filename)
+        self._segment = segments[-1][0] if segments else 0
+        self._compressor = SegmentCompressor(backup_count)
+
+    def doRollover(self) -> None:  # noqa: N802
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        self._segment += 1
+        segment = f"{self.baseFilename}.{self._segment}"
+        os.rename(self.baseFilename, segment)
+        self._compressor.submit(segment)
+
+        if not self.delay:
+            self.stream = self._open()
+
+    def drain(self) -> None:
+        """Flush the shard and wait for background compression of its segments."""
+        self.flush()
+        self._compressor.join()
+
+
 class Logger(metaclass=Singleton):
     def __init__(
         self,
@@ -28,17 +152,23 @@ class Logger(metaclass=Singleton):
         log_base_directory: Optional[str] = None,
         log_mode: str = "w",  # 'w' for overwrite, 'a' for append
         console_logging: bool = True,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 20,
     ) -> None:
         self._log = logging.getLogger("mobile")
         self._log.setLevel(LogLevel.DEBUG.value)
+        self._log.addFilter(ContextFilter())
 
         self.log_base_directory = log_base_directory or os.path.abspath(
             os.path.join(os.path.dirname(__file__), "../..")
         )
         self.log_file = self._create_log_file()
-        self._initialize_logging(log_lvl, log_mode, console_logging)
+        self._initialize_logging(
+            log_lvl, log_mode, console_logging, max_bytes, backup_count
+        )
 
     def _create_log_file(self) -> str:
+        """One log shard per pytest-xdist worker, e.g. log_2025-01-01_gw0.log."""
         current_time = time.strftime("%Y-%m-%d")
         log_directory = os.path.join(self.log_base_directory, "reports/logs")
 
@@ -46,17 +176,20 @@ class Logger(metaclass=Singleton):
             log_directory, exist_ok=True
         )  # Create directory if it doesn't exist
 
-        return os.path.join(log_directory, f"log_{current_time}.log")
+        return os.path.join(log_directory, f"log_{current_time}_{worker_id()}.log")
 
     def _initialize_logging(
-        self, log_lvl: LogLevel, log_mode: str, console_logging: bool
+        self,
+        log_lvl: LogLevel,
+        log_mode: str,
+        console_logging: bool,
+        max_bytes: int,
+        backup_count: int,
     ) -> None:
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
+        formatter = logging.Formatter(LOG_FORMAT)
 
         # File handler
-        fh = logging.FileHandler(self.log_file, mode=log_mode)
+        fh = ShardFileHandler(self.log_file, log_mode, max_bytes, backup_count)
         fh.setFormatter(formatter)
         fh.setLevel(log_lvl.value)
         self._log.addHandler(fh)
@@ -71,6 +204,12 @@ class Logger(metaclass=Singleton):
     def get_instance(self) -> logging.Logger:
         return self._log
 
+    def drain(self) -> None:
+        """Finish writing the shard, call before the shards are merged."""
+        for handler in self._log.handlers:
+            if isinstance(handler, ShardFileHandler):
+                handler.drain()
+
     def annotate(
         self, message: str, level: Literal["info", "warn", "debug", "error"] = "info"
     ) -> None:
@@ -0,0 +1,237 @@
+import glob
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Optional
+
+import pytest
+
+REPORT_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../..", "reports")
+)
+PAGE_SIZE = 200
+
+
+def store_artifact(
+    data: bytes, suffix: str = ".png", report_dir: str = REPORT_DIR
+) -> str:
+    """Store an artifact (screenshot) as a content-addressed file.
+
+    Identical screenshots are stored once.
+
+    :return: path relative to the report directory
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    relative = os.path.join("artifacts", digest[:2], f"{digest}{suffix}")
+    path = os.path.join(report_dir, relative)
+    if os.path.exists(path):
+        return relative
+
+    # Workers may store the same screenshot at once, each writes its own file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        if not os.path.exists(path):
+            raise
+    return relative
+
+
+class ShardedReport:
+    """pytest plugin writing test results as JSON lines while tests finish.
+
+    Every process (pytest-xdist worker) appends to its own shard
+    `results/results-<worker>.jsonl`, screenshots are referenced by path.
+    After the run `build_report` merges the shards into paginated report data
+    loaded lazily by `report.html`.
+    """
+
+    def __init__(self, worker: str, report_dir: str = REPORT_DIR):
+        self.worker = worker
+        self.report_dir = report_dir
+        self.results_dir = os.path.join(report_dir, "results")
+        self._file = None
+
+    def _write(self, record: dict) -> None:
+        if self._file is None:
+            os.makedirs(self.results_dir, exist_ok=True)
+            path = os.path.join(self.results_dir, f"results-{self.worker}.jsonl")
+            self._file = open(path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    @pytest.hookimpl
+    def pytest_configure(self, config):
+        if not hasattr(config, "workerinput"):
+            # Controller, results of the previous run are removed once
+            shutil.rmtree(self.results_dir, ignore_errors=True)
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        if getattr(report, "node", None) is not None:
+            return  # Forwarded by pytest-xdist, already written by the worker
+        if report.when != "call" and report.passed:
+            return
+
+        properties = dict(report.user_properties)
+        self._write(
+            {
+                "nodeid": report.nodeid,
+                "when": report.when,
+                "outcome": report.outcome,
+                "duration": round(report.duration, 3),
+                "worker": self.worker,
+                "finished": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "screenshot": properties.get("screenshot"),
+                "longrepr": str(report.longrepr) if report.failed else None,
+            }
+        )
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if not hasattr(session.config, "workerinput"):
+            build_report(self.report_dir)
+
+
+def build_report(
+    report_dir: str = REPORT_DIR, page_size: int = PAGE_SIZE
+) -> Optional[str]:
+    """Merge result shards into report pages in one pass.
+
+    Pages are written as `data/page-<n>.js` scripts, which `report.html`
+    loads on demand (works from file:// without a web server).
+
+    :return: path of report.html, None if there are no results
+    """
+    shards = sorted(
+        glob.glob(os.path.join(glob.escape(report_dir), "results", "*.jsonl"))
+    )
+    if not shards:
+        return None
+
+    data_dir = os.path.join(report_dir, "data")
+    shutil.rmtree(data_dir, ignore_errors=True)
+    os.makedirs(data_dir)
+
+    totals = {}
+    page, pages = [], 0
+
+    def write_page():
+        with open(
+            os.path.join(data_dir, f"page-{pages}.js"), "w", encoding="utf-8"
+        ) as f:
+            f.write(f"window.reportPage({pages}, {json.dumps(page)});\n")
+
+    for shard in shards:
+        with open(shard, encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                totals[record["outcome"]] = totals.get(record["outcome"], 0) + 1
+                page.append(record)
+                if len(page) == page_size:
+                    pages += 1
+                    write_page()
+                    page = []
+    if page:
+        pages += 1
+        write_page()
+
+    index = {
+        "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "totals": totals,
+        "pages": pages,
+    }
+    with open(os.path.join(data_dir, "index.js"), "w", encoding="utf-8") as f:
+        f.write(f"window.reportIndex({json.dumps(index)});\n")
+
+    report = os.path.join(report_dir, "report.html")
+    with open(report, "w", encoding="utf-8") as f:
+        f.write(REPORT_HTML)
+    return report
+
+
+REPORT_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Test report</title>
+<style>
+  body { font-family: sans-serif; margin: 1em; }
+  table { border-collapse: collapse; width: 100%; }
+  td, th { border: 1px solid #ccc; padding: 4px; vertical-align: top; text-align: left; }
+  .passed { color: green; } .failed { color: red; } .skipped { color: gray; }
+  pre { white-space: pre-wrap; max-height: 20em; overflow: auto; margin: 0; }
+  img { max-height: 240px; }
+</style>
+</head>
+<body>
+<h1>Test report</h1>
+<p id="summary"></p>
+<p><button id="prev">&larr;</button> <span id="page"></span> <button id="next">&rarr;</button></p>
+<table>
+  <thead><tr><th>Test</th><th>Outcome</th><th>Duration, s</th><th>Worker</th><th>Details</th></tr></thead>
+  <tbody id="rows"></tbody>
+</table>
+<script>
+  var index = null, current = 1, loaded = {};
+
+  function load(src) {
+    var script = document.createElement("script");
+    script.src = src;
+    document.body.appendChild(script);
+  }
+
+  function text(value) {
+    var node = document.createElement("div");
+    node.textContent = value;
+    return node.innerHTML;
+  }
+
+  window.reportIndex = function (data) {
+    index = data;
+    document.getElementById("summary").textContent = "Generated " + data.generated +
+      ": " + Object.keys(data.totals).map(function (k) { return data.totals[k] + " " + k; }).join(", ");
+    show(1);
+  };
+
+  window.reportPage = function (n, records) {
+    loaded[n] = records;
+    if (n === current) render(records);
+  };
+
+  function show(n) {
+    if (!index || n < 1 || n > index.pages) return;
+    current = n;
+    document.getElementById("page").textContent = "Page " + n + " of " + index.pages;
+    if (loaded[n]) render(loaded[n]); else load("data/page-" + n + ".js");
+  }
+
+  function render(records) {
+    document.getElementById("rows").innerHTML = records.map(function (r) {
+      var details = "";
+      if (r.longrepr) details += "<pre>" + text(r.longrepr) + "</pre>";
+      if (r.screenshot) details += '<a href="' + r.screenshot + '"><img loading="lazy" src="' + r.screenshot + '"></a>';
+      return "<tr><td>" + text(r.nodeid) + (r.when !== "call" ? " (" + r.when + ")" : "") +
+        '</td><td class="' + r.outcome + '">' + r.outcome + "</td><td>" + r.duration +
+        "</td><td>" + text(r.worker) + "</td><td>" + details + "</td></tr>";
+    }).join("");
+  }
+
+  document.getElementById("prev").onclick = function () { show(current - 1); };
+  document.getElementById("next").onclick = function () { show(current + 1); };
+  load("data/index.js");
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,43 @@
+import time
+
+import pytest
+from locators.locators import Locators
+from screens.main_screen.main_screen import MainScreen
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+ATTRS = ["text", "content-desc", "displayed"]
+
+
+@pytest.mark.benchmark
+class TestElementsDataBenchmark:
+    @pytest.fixture(autouse=True)
+    def setup(self, driver) -> None:
+        """Open main menu with a list of TextViews."""
+        self.main_screen = MainScreen(driver)
+        self.locator = Locators.main_menu.MENU_ELEMENTS
+
+    def test_bulk_vs_per_element(self, setup):
+        start = time.perf_counter()
+        elements = self.main_screen.elements(self.locator)
+        per_element = [
+            {
+                "text": element.text,
+                "content-desc": element.get_attribute("content-desc"),
+                "displayed": element.is_displayed(),
+            }
+            for element in elements
+        ]
+        per_element_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bulk = self.main_screen.elements_data(self.locator, ATTRS)
+        bulk_time = time.perf_counter() - start
+
+        log.info(
+            f"{len(elements)} elements x {len(ATTRS)} attributes: "
+            f"per element {per_element_time:.2f}s, bulk {bulk_time:.2f}s"
+        )
+        assert [row["text"] for row in bulk] == [row["text"] for row in per_element]
+        assert bulk_time < per_element_time
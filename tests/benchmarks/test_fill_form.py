@@ -0,0 +1,47 @@
+import time
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from screens.main_screen.main_screen import MainScreen
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+FIELDS = 20
+EDIT_TEXT = (AppiumBy.CLASS_NAME, "android.widget.EditText")
+
+
+@pytest.mark.benchmark
+class TestFillFormBenchmark:
+    @pytest.fixture(autouse=True)
+    def setup(self, driver) -> None:
+        """Open Views > TextFields."""
+        self.main_screen = MainScreen(driver)
+        self.main_screen.open_text_fields()
+
+    def test_time_per_field(self, setup):
+        # TextFields has a few inputs, 20 fields are filled in rounds over them
+        count = len(self.main_screen.elements_data(EDIT_TEXT, ["tag"]))
+        locators = [
+            (AppiumBy.XPATH, f"(//android.widget.EditText)[{i + 1}]")
+            for i in range(count)
+        ]
+        rounds = -(-FIELDS // count)
+
+        start = time.perf_counter()
+        for n in range(rounds):
+            for locator in locators:
+                self.main_screen.click(locator)
+                self.main_screen.type(locator, f"value {n}")
+        per_field_type = (time.perf_counter() - start) / (rounds * count)
+
+        start = time.perf_counter()
+        for n in range(rounds):
+            self.main_screen.fill_form(dict.fromkeys(locators, f"form {n}"), verify=True)
+        per_field_form = (time.perf_counter() - start) / (rounds * count)
+
+        log.info(
+            f"Time per field: click + type {per_field_type * 1000:.0f} ms, "
+            f"fill_form {per_field_form * 1000:.0f} ms"
+        )
+        assert per_field_form < per_field_type
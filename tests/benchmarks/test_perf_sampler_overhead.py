@@ -0,0 +1,45 @@
+import time
+
+import pytest
+from drivers.app_state import CommandRunner
+from drivers.perf_sampler import AdbPerfSource, PerfSampler
+from screens.main_screen.main_screen import MainScreen
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+ROUNDS = 3
+
+
+@pytest.mark.benchmark
+class TestPerfSamplerOverhead:
+    @pytest.fixture(autouse=True)
+    def setup(self, driver) -> None:
+        """Main screen and a low-overhead (adb) sampler."""
+        self.main_screen = MainScreen(driver)
+        package = driver.capabilities["appPackage"]
+        self.sampler = PerfSampler(
+            AdbPerfSource(CommandRunner(), package), interval=0.5
+        )
+
+    def flow(self) -> float:
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            self.main_screen.scroll_view_by_coordinates(direction="down")
+            self.main_screen.back()
+        return time.perf_counter() - start
+
+    def test_sampler_does_not_slow_test_thread(self, setup):
+        self.flow()  # warm up
+        without_sampler = self.flow()
+
+        self.sampler.start("overhead")
+        with_sampler = self.flow()
+        self.sampler.stop()
+
+        log.info(
+            f"Flow without sampler {without_sampler:.2f}s, with sampler "
+            f"{with_sampler:.2f}s, sampling took {self.sampler.sample_seconds:.2f}s "
+            f"on the sampler thread"
+        )
+        assert with_sampler < without_sampler * 1.1
@@ -0,0 +1,46 @@
+import time
+
+import pytest
+from screens.main_screen.main_screen import MainScreen
+from screens.progress_bar_screen.progress_bar_screen import ProgressBarScreen
+from screens.settings_profile import Profiles, SettingsProfile
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+FINDS = 3
+# UiAutomator2/XCUITest defaults, overrides the ANIMATED profile of the screen
+DEFAULT = SettingsProfile(
+    "default", android={"waitForIdleTimeout": 10000}, ios={"waitForIdleTimeout": 10}
+)
+
+
+@pytest.mark.benchmark
+class TestSettingsProfilesBenchmark:
+    @pytest.fixture(autouse=True)
+    def setup(self, driver) -> None:
+        self.main_screen = MainScreen(driver)
+        self.progress_bar_screen = ProgressBarScreen(driver)
+
+    def flow(self) -> float:
+        """Open the endlessly animated Progress Bar screen and count spinners."""
+        self.main_screen.restart_app()
+        start = time.perf_counter()
+        self.main_screen.open_progress_bars()
+        for _ in range(FINDS):
+            assert self.progress_bar_screen.spinners_count() > 0
+        return time.perf_counter() - start
+
+    def test_flow_latency_per_profile(self, setup):
+        latency = {}
+        for profile in (DEFAULT, Profiles.ANIMATED):
+            with self.progress_bar_screen.using_settings(profile):
+                latency[profile.name] = self.flow()
+        # Declarative path: ProgressBarScreen.settings_profile
+        latency["screen profile"] = self.flow()
+
+        for name, seconds in latency.items():
+            log.info(f"Progress Bar flow with '{name}' profile: {seconds:.1f} s")
+
+        assert latency["animated"] < latency["default"]
+        assert latency["screen profile"] < latency["default"]
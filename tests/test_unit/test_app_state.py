@@ -0,0 +1,97 @@
+import os
+import shlex
+
+from drivers.app_state import (
+    AndroidAppDataBackend,
+    AppStateStore,
+    AvdSnapshotBackend,
+    build_hash,
+)
+
+
+class FakeRunner:
+    """Records device commands instead of running them."""
+
+    def __init__(self):
+        self.commands = []
+
+    def __call__(self, args, stdin_path=None, stdout_path=None, timeout=120):
+        self.commands.append(list(args))
+        if stdout_path:
+            stdout_path.write_bytes(b"app data")
+        return ""
+
+
+class TestAppStateStore:
+    def test_ensure_builds_and_captures_once(self, tmp_path):
+        runner = FakeRunner()
+        restored = []
+        store = AppStateStore(
+            AndroidAppDataBackend(runner, "io.appium.android.apis"),
+            "build-1",
+            root=tmp_path,
+            on_restore=lambda: restored.append(True),
+        )
+        built = []
+
+        assert store.ensure("logged_in", lambda: built.append(True)) is False
+        assert store.ensure("logged_in", lambda: built.append(True)) is True
+        assert built == [True]
+        assert restored == [True]
+        assert (tmp_path / "logged_in/build-1/data.tar").read_bytes() == b"app data"
+
+    def test_restore_runs_force_stop_and_untar(self, tmp_path):
+        runner = FakeRunner()
+        store = AppStateStore(
+            AndroidAppDataBackend(runner, "pkg", serial="emulator-5554"),
+            "build-1",
+            root=tmp_path,
+        )
+        store.capture("state")
+        runner.commands.clear()
+
+        store.restore("state")
+
+        assert runner.commands[0] == [
+            "adb", "-s", "emulator-5554", "shell", "am", "force-stop", "pkg"
+        ]
+        assert runner.commands[-1][:4] == ["adb", "-s", "emulator-5554", "exec-in"]
+        assert runner.commands[-1][-1] == "'tar -xf -'"
+
+    def test_run_as_script_is_one_device_shell_argument(self, tmp_path):
+        runner = FakeRunner()
+        AndroidAppDataBackend(runner, "pkg").capture(tmp_path)
+
+        # adb exec-out joins the arguments with spaces for the device shell
+        device_command = " ".join(runner.commands[0][2:])
+
+        assert device_command == (
+            "run-as pkg sh -c 'tar -cf - $(ls -d shared_prefs databases files "
+            "no_backup 2>/dev/null)'"
+        )
+        assert shlex.split(device_command)[-1].startswith("tar -cf - $(ls -d")
+
+    def test_new_build_invalidates_old_states(self, tmp_path):
+        runner = FakeRunner()
+        old = AppStateStore(AvdSnapshotBackend(runner, "emulator-5554"), "old", tmp_path)
+        new = AppStateStore(AvdSnapshotBackend(runner, "emulator-5554"), "new", tmp_path)
+        old.capture("logged_in")
+
+        assert new.restore("logged_in") is False
+        new.ensure("logged_in", lambda: None)
+
+        assert not (tmp_path / "logged_in/old").exists()
+        assert (tmp_path / "logged_in/new/snapshot").read_text() == "logged_in_new"
+
+    def test_build_hash_is_cached_until_the_binary_changes(self, tmp_path):
+        app = tmp_path / "demo.apk"
+        app.write_bytes(b"build 1")
+        first = build_hash(str(app))
+        stat = app.stat()
+
+        app.write_bytes(b"build 2")  # Same size, mtime restored: not re-hashed
+        os.utime(app, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert build_hash(str(app)) == first
+
+        os.utime(app, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert build_hash(str(app)) != first
@@ -0,0 +1,43 @@
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+
+import screens.page_source
+from screens.base_screen import Screen
+
+IOS_SOURCE = """<?xml version="1.0" encoding="UTF-8"?>
+<AppiumAUT>
+  <XCUIElementTypeTextField type="XCUIElementTypeTextField" name="login"
+                            label="Login" value="user" visible="true"/>
+</AppiumAUT>"""
+LOGIN = (AppiumBy.ACCESSIBILITY_ID, "login")
+LOGIN_XPATH = (
+    AppiumBy.XPATH,
+    '//XCUIElementTypeTextField[@name="login" and @visible="true"]',
+)
+
+
+class FakeElement:
+    def get_attribute(self, name):
+        return {"value": "user", "label": "Login"}[name]
+
+
+class IOSDriver:
+    capabilities = {"platformName": "iOS"}
+    page_source = IOS_SOURCE
+
+
+class TestFillFormVerify:
+    def test_ios_fields_are_verified_by_value_not_label(self):
+        screen = Screen(IOSDriver())
+
+        screen._verify_form({LOGIN: "user"}, {LOGIN: FakeElement()})
+        with pytest.raises(AssertionError):
+            screen._verify_form({LOGIN: "Login"}, {LOGIN: FakeElement()})
+
+    def test_xpath_unsupported_by_elementtree_is_read_from_element(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(screens.page_source, "etree", None)
+        screen = Screen(IOSDriver())
+
+        screen._verify_form({LOGIN_XPATH: "user"}, {LOGIN_XPATH: FakeElement()})
@@ -0,0 +1,113 @@
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException
+from urllib3.exceptions import MaxRetryError
+
+from drivers.session_health import SessionDeadError, SessionHealth
+from screens.checkpoint import StepStats, step
+from screens.main_screen.main_screen import MainScreen
+
+
+class FlakyScreen:
+    def __init__(self, failures):
+        self.failures = list(failures)
+        self.restored = 0
+
+    def ensure_start(self):
+        """Checkpoint: start"""
+        self.restored += 1
+
+    @step(precondition="ensure_start", attempts=3)
+    def late_step(self):
+        """Late step of a long flow"""
+        if self.failures:
+            raise self.failures.pop(0)
+        return "done"
+
+
+class TapDriver:
+    def __init__(self):
+        self.taps = 0
+
+    def tap(self, positions, duration=None):
+        self.taps += 1
+
+
+class TabElement:
+    location = {"x": 0, "y": 0}
+    size = {"width": 100, "height": 50}
+
+
+class FlakyMainScreen(MainScreen):
+    """Main screen whose element lookups fail first."""
+
+    def __init__(self, driver, failures):
+        super().__init__(driver)
+        self.failures = list(failures)
+        self.restored = []
+
+    def element(self, locator, **kwargs):
+        if self.failures:
+            raise self.failures.pop(0)
+        return TabElement()
+
+    def scroll_until_element_visible(self, destination_el, **kwargs):
+        pass
+
+    def ensure_views(self):
+        self.restored.append("views")
+
+
+class TestStep:
+    def test_transient_failure_is_retried_from_checkpoint(self):
+        stats = StepStats()
+        retries = len(stats.retries)
+        screen = FlakyScreen([TimeoutException("slow"), TimeoutException("slow")])
+
+        assert screen.late_step() == "done"
+        assert screen.restored == 2
+        assert [r["step"] for r in stats.retries[retries:]] == [
+            "FlakyScreen.late_step",
+            "FlakyScreen.late_step",
+        ]
+
+    def test_attempts_are_bounded(self):
+        screen = FlakyScreen([TimeoutException("slow")] * 3)
+
+        with pytest.raises(TimeoutException):
+            screen.late_step()
+        assert screen.restored == 2
+
+    def test_fatal_and_assertion_errors_are_not_retried(self):
+        health = SessionHealth()
+        with pytest.raises(SessionDeadError) as dead:
+            health.guard(MaxRetryError(None, "/session", "Connection refused"))
+        errors = (
+            InvalidSessionIdException("gone"),
+            AssertionError("wrong"),
+            dead.value,
+            TimeoutException("slow"),  # Transient, but the breaker is open
+        )
+
+        try:
+            for error in errors:
+                screen = FlakyScreen([error])
+
+                with pytest.raises(type(error)):
+                    screen.late_step()
+                assert screen.restored == 0
+        finally:
+            health.reset()
+
+    def test_failed_tap_retries_only_its_step(self):
+        driver = TapDriver()
+        screen = FlakyMainScreen(driver, [TimeoutException("slow")])
+
+        screen.open_scrollable_tabs()
+
+        assert screen.restored == ["views"]
+        assert driver.taps == 2  # Tabs and 5. Scrollable after the retry
+
+    def test_tap_outside_a_step_is_lenient(self):
+        screen = FlakyMainScreen(TapDriver(), [TimeoutException("slow")])
+
+        screen.tap(screen.locators.main_menu.VIEWS_LINK)
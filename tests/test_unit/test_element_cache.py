@@ -0,0 +1,58 @@
+from selenium.common.exceptions import StaleElementReferenceException
+
+from screens.element_cache import CacheStats, ElementCache
+
+
+class FakeElement:
+    def __init__(self, stale=False, enabled=True):
+        self.stale = stale
+        self.enabled = enabled
+
+    @property
+    def rect(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale")
+        return {"x": 0, "y": 0, "width": 10, "height": 10}
+
+    def is_enabled(self):
+        return self.enabled
+
+
+class TestElementCache:
+    def test_hit_and_stale_eviction(self):
+        cache = ElementCache()
+        stats = CacheStats()
+        hits, stale = stats.hits, stats.stale
+        element = FakeElement()
+        cache.put(("id", "a"), element)
+
+        assert cache.get(("id", "a")) is element
+        element.stale = True
+        assert cache.get(("id", "a")) is None
+        assert cache.get(("id", "a")) is None
+        assert (stats.hits - hits, stats.stale - stale) == (1, 1)
+
+    def test_disabled_element_is_not_clickable(self):
+        cache = ElementCache()
+        cache.put(("id", "a"), FakeElement(enabled=False))
+
+        assert cache.get(("id", "a"), condition="visible") is not None
+        assert cache.get(("id", "a"), condition="clickable") is None
+
+    def test_lru_size_cap(self):
+        cache = ElementCache(max_size=2)
+        for name in "abc":
+            cache.put(("id", name), FakeElement())
+
+        assert cache.get(("id", "a")) is None
+        assert cache.get(("id", "c")) is not None
+
+    def test_invalidate_others(self):
+        own, other = ElementCache(), ElementCache()
+        own.put(("id", "a"), FakeElement())
+        other.put(("id", "a"), FakeElement())
+
+        ElementCache.invalidate_others(own)
+
+        assert own.get(("id", "a")) is not None
+        assert other.get(("id", "a")) is None
@@ -0,0 +1,154 @@
+import time
+
+import pytest
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchElementException,
+    TimeoutException,
+)
+from selenium.webdriver.support.wait import WebDriverWait
+
+from drivers.session_health import SessionDeadError, SessionHealth
+from locators.fallback_index import FallbackIndex
+from locators.locators import Locators
+from screens.element_interactor import ElementInteractor, WaitType
+
+LOCATOR = ("accessibility id", "Views")
+HEALED = ("xpath", "//android.widget.TextView[@text='Views']")
+SOURCE = """<hierarchy>
+  <android.widget.TextView text="{text}" displayed="true"/>
+</hierarchy>"""
+
+
+class DeadDriver:
+    """Driver of a session killed on the server."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def find_element(self, *locator):
+        self.calls += 1
+        raise InvalidSessionIdException("invalid session id")
+
+    find_elements = find_element
+
+
+class GestureDriver:
+    """Accepts W3C actions, e.g. a scroll."""
+
+    def __init__(self):
+        self.actions = []
+
+    def execute(self, command, params=None):
+        self.actions.append(command)
+        return {"value": None}
+
+
+class DriftedDriver:
+    """The "Views" row lost its content-desc, it is found by text only."""
+
+    def __init__(self, text="Views"):
+        self.page_source = SOURCE.format(text=text)
+        self.text = text
+
+    def find_element(self, by, value):
+        if (by, value) == HEALED and self.text == "Views":
+            return VisibleElement()
+        raise NoSuchElementException(value)
+
+
+class VisibleElement:
+    def is_displayed(self):
+        return True
+
+
+class CachedScreen(ElementInteractor):
+    cache_elements = True
+
+
+class TestElementInteractor:
+    @pytest.fixture(autouse=True)
+    def health(self):
+        self.health = SessionHealth()
+        self.health.reset()
+        yield
+        self.health.reset()
+
+    def test_dead_session_fails_fast(self):
+        driver = DeadDriver()
+        screen = ElementInteractor(driver)
+        with pytest.raises(SessionDeadError):
+            screen.element(LOCATOR)
+        calls, saved = driver.calls, self.health.saved_seconds
+
+        start = time.monotonic()
+        for lookup in (
+            screen.element,
+            screen.elements,
+            screen.is_displayed,
+            screen.is_exist,
+        ):
+            with pytest.raises(SessionDeadError):
+                lookup(LOCATOR)
+
+        assert time.monotonic() - start < 0.5
+        assert driver.calls == calls
+        # Only the retry delays of is_displayed and is_exist were skipped
+        assert self.health.saved_seconds - saved == pytest.approx(3.0)
+
+    def test_scroll_clears_own_element_cache(self):
+        driver = GestureDriver()
+        screen = CachedScreen(driver)
+        screen.cache.put(LOCATOR, object())
+
+        screen._mutated()
+        assert LOCATOR in screen.cache._elements
+
+        screen.scroll_by_coordinates(500, 1500, 500, 500)
+
+        assert driver.actions
+        assert LOCATOR not in screen.cache._elements
+
+
+class TestFindOrHeal:
+    @pytest.fixture(autouse=True)
+    def index(self):
+        index = FallbackIndex()
+        saved = dict(vars(index))
+        index.healing, index.healed = True, {}
+        index.entries = {
+            "main_menu.VIEWS_LINK": {
+                "locator": list(Locators.main_menu.VIEWS_LINK),
+                "alternatives": [[*HEALED, "text"]],
+            }
+        }
+        yield
+        vars(index).update(saved)
+
+    def screen(self, driver, probe=0.5, timeout=1.0):
+        screen = ElementInteractor(driver)
+        for wait_type, seconds in (
+            (WaitType.SHORTEST, probe),
+            (WaitType.DEFAULT, timeout),
+        ):
+            screen.waiters[wait_type] = WebDriverWait(
+                driver, seconds, poll_frequency=0.05
+            )
+        return screen
+
+    def test_drifted_locator_is_healed(self):
+        screen = self.screen(DriftedDriver())
+
+        element = screen.element(Locators.main_menu.VIEWS_LINK)
+
+        assert isinstance(element, VisibleElement)
+
+    def test_missing_element_fails_within_the_timeout(self):
+        screen = self.screen(DriftedDriver(text="Gallery"))
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutException):
+            screen.element(Locators.main_menu.VIEWS_LINK)
+
+        # Probe and heal are part of the 1 s timeout, not added to it
+        assert time.monotonic() - start < 1.3
@@ -0,0 +1,78 @@
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+
+from locators.fallback_index import FallbackIndex, locator_names
+from locators.locators import Locators
+
+RECORDED = """<?xml version="1.0" encoding="UTF-8"?>
+<hierarchy rotation="0">
+  <android.widget.ListView resource-id="android:id/list" bounds="[0,0][1080,2000]">
+    <android.widget.TextView text="Access" content-desc="Access" bounds="[0,0][1080,100]"/>
+    <android.widget.TextView text="Views" content-desc="Views" bounds="[0,100][1080,200]"/>
+  </android.widget.ListView>
+</hierarchy>"""
+# The content-desc of "Views" was removed by an app update
+DRIFTED = RECORDED.replace(' content-desc="Views"', "")
+# Another list screen, a row at the same position is not the "Views" row
+OTHER_SCREEN = RECORDED.replace("Access", "Animation").replace("Views", "Gallery")
+
+
+class FakeDriver:
+    page_source = RECORDED
+
+
+class TestFallbackIndex:
+    @pytest.fixture(autouse=True)
+    def index(self, tmp_path):
+        self.index = FallbackIndex()
+        self.saved = dict(vars(self.index))
+        self.index.partial_dir = str(tmp_path)
+        self.index.entries, self.index.healed = {}, {}
+        self.index.recording, self.index.healing = True, True
+        self.index._recorded = set()
+        yield
+        vars(self.index).update(self.saved)
+
+    def test_locator_names(self):
+        names = locator_names()
+
+        assert names[Locators.main_menu.VIEWS_LINK] == "main_menu.VIEWS_LINK"
+        assert (
+            names[Locators.views_menu.text_fields.HINT_INPUT]
+            == "views_menu.text_fields.HINT_INPUT"
+        )
+
+    def test_record_ranks_alternatives(self):
+        self.index.record(Locators.main_menu.VIEWS_LINK, FakeDriver())
+
+        entry = self.index.entries["main_menu.VIEWS_LINK"]
+        assert entry["alternatives"] == [
+            [AppiumBy.XPATH, "//android.widget.TextView[@text='Views']", "text"]
+        ]
+
+    def test_heal_drifted_locator(self):
+        self.index.record(Locators.main_menu.VIEWS_LINK, FakeDriver())
+
+        healed = self.index.heal(Locators.main_menu.VIEWS_LINK, DRIFTED)
+
+        assert healed == (AppiumBy.XPATH, "//android.widget.TextView[@text='Views']")
+        assert "main_menu.VIEWS_LINK" in self.index.healed
+
+    def test_no_healing_while_primary_is_present(self):
+        self.index.record(Locators.main_menu.VIEWS_LINK, FakeDriver())
+
+        assert self.index.heal(Locators.main_menu.VIEWS_LINK, RECORDED) is None
+
+    def test_no_healing_on_another_screen(self):
+        self.index.record(Locators.main_menu.VIEWS_LINK, FakeDriver())
+
+        assert self.index.heal(Locators.main_menu.VIEWS_LINK, OTHER_SCREEN) is None
+
+    def test_controller_merges_worker_recordings(self):
+        self.index.record(Locators.main_menu.VIEWS_LINK, FakeDriver())
+        self.index.save_partial("gw1")
+        self.index.entries = {}
+
+        self.index.merge_partials()
+
+        assert list(self.index.entries) == ["main_menu.VIEWS_LINK"]
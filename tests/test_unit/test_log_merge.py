@@ -0,0 +1,78 @@
+import gzip
+import io
+
+from utils.log_merge import (
+    filter_log,
+    merge_logs,
+    merged_log,
+    read_records,
+    remove_stale_shards,
+)
+
+
+def line(time, worker, test_id, message):
+    return (
+        f"2025-01-01 12:00:{time},000 - mobile - INFO - "
+        f"[{worker}] [{test_id}] - {message}\n"
+    )
+
+
+class TestLogMerge:
+    def test_merge_is_time_ordered_across_shards_and_segments(self, tmp_path):
+        gw0 = tmp_path / "log_2025-01-01_gw0.log"
+        gw1 = tmp_path / "log_2025-01-01_gw1.log"
+        with gzip.open(f"{gw0}.1.gz", "wt") as f:
+            f.write(line("01", "gw0", "test_a", "first"))
+        gw0.write_text(
+            line("04", "gw0", "test_a", "Traceback:") + "  File x.py, line 1\n"
+        )
+        gw1.write_text(
+            line("02", "gw1", "test_b", "second") + line("03", "gw1", "test_b", "third")
+        )
+        merged = tmp_path / "log_2025-01-01.log"
+
+        assert merge_logs([str(gw0), str(gw1)], str(merged)) == 4
+        lines = merged.read_text().splitlines()
+        assert [entry.rsplit(" - ", 1)[-1] for entry in lines] == [
+            "first",
+            "second",
+            "third",
+            "Traceback:",
+            "  File x.py, line 1",
+        ]
+
+    def test_filter_by_test_id(self, tmp_path):
+        log = tmp_path / "log.log"
+        log.write_text(
+            line("01", "gw0", "tests/a.py::TestA::test_a", "a")
+            + "  continuation of a\n"
+            + line("02", "gw1", "tests/a.py::TestA::test_b", "b")
+        )
+        out = io.StringIO()
+
+        assert filter_log(str(log), "test_a", out) == 1
+        assert out.getvalue().endswith("- a\n  continuation of a\n")
+
+    def test_stale_shards_of_earlier_runs_are_removed(self, tmp_path):
+        main = tmp_path / "log_2025-01-01_main.log"
+        stale = tmp_path / "log_2025-01-01_gw3.log"
+        merged = tmp_path / "log_2025-01-01.log"
+        for path in (main, stale, merged, tmp_path / "log_2025-01-01_gw3.log.1.gz"):
+            path.write_text("")
+
+        remove_stale_shards(str(main), str(tmp_path), "2025-01-01")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [main.name]
+        assert merged_log(str(tmp_path), "2025-01-01") == str(main)
+
+    def test_segment_compressed_after_listing_is_read(self, tmp_path):
+        shard = tmp_path / "log_2025-01-01_gw0.log"
+        with gzip.open(f"{shard}.1.gz", "wt") as f:
+            f.write(line("01", "gw0", "test_a", "rotated"))
+        merged = tmp_path / "log_2025-01-01.log"
+
+        # log.1 was listed, then compressed to log.1.gz and removed
+        assert list(read_records([f"{shard}.1"])) == [
+            line("01", "gw0", "test_a", "rotated")
+        ]
+        assert merge_logs([str(shard)], str(merged)) == 1
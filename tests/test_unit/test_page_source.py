@@ -0,0 +1,50 @@
+from appium.webdriver.common.appiumby import AppiumBy
+
+from screens.page_source import PageSource
+
+SOURCE = """<?xml version="1.0" encoding="UTF-8"?>
+<hierarchy rotation="0">
+  <android.widget.FrameLayout resource-id="android:id/content" displayed="true">
+    <android.widget.TextView text="Access" content-desc="Access" displayed="true"/>
+    <android.widget.TextView text="Views" content-desc="Views" displayed="true"/>
+    <android.widget.CheckBox text="false" checked="true" displayed="true"/>
+    <android.widget.EditText resource-id="io.appium.android.apis:id/edit"
+                             text="hint" displayed="false"/>
+  </android.widget.FrameLayout>
+</hierarchy>"""
+
+
+class TestPageSource:
+    def test_records_by_xpath(self):
+        rows = PageSource(SOURCE).records(
+            (AppiumBy.XPATH, "//android.widget.TextView"), ["text", "displayed"]
+        )
+
+        assert rows == [
+            {"text": "Access", "displayed": True},
+            {"text": "Views", "displayed": True},
+        ]
+
+    def test_records_by_id_and_accessibility_id(self):
+        source = PageSource(SOURCE)
+
+        assert source.records((AppiumBy.ID, "edit"), ["displayed"]) == [
+            {"displayed": False}
+        ]
+        assert source.records((AppiumBy.ACCESSIBILITY_ID, "Views"), ["tag"]) == [
+            {"tag": "android.widget.TextView"}
+        ]
+
+    def test_streaming_matches_full_parse(self):
+        locator = (AppiumBy.XPATH, "//android.widget.TextView")
+
+        streamed = list(PageSource.iter_records(SOURCE, locator, ["text"]))
+
+        assert streamed == PageSource(SOURCE).records(locator, ["text"])
+
+    def test_only_boolean_attributes_are_converted(self):
+        rows = PageSource(SOURCE).records(
+            (AppiumBy.CLASS_NAME, "android.widget.CheckBox"), ["text", "checked"]
+        )
+
+        assert rows == [{"text": "false", "checked": True}]
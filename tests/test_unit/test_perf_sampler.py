@@ -0,0 +1,55 @@
+import time
+
+from drivers.perf_sampler import AdbPerfSource, PerfSampler, detect_regressions
+from screens.element_interactor import ElementInteractor
+
+
+class FakeSource:
+    def __init__(self):
+        self.memory = 100.0
+
+    def sample(self):
+        self.memory += 1
+        return {"memory": self.memory, "cpu": 5.0}
+
+
+class FakeDriver:
+    capabilities = {"platformName": "Android"}
+
+
+class SlowScreen(ElementInteractor):
+    def slow_step(self):
+        time.sleep(0.2)
+
+
+class TestPerfSampler:
+    def test_samples_are_grouped_by_test_and_screen_method(self):
+        sampler = PerfSampler(FakeSource(), interval=0.02)
+
+        sampler.start("test_flow")
+        SlowScreen(FakeDriver()).slow_step()
+        sampler.stop()
+
+        summary = sampler.summary()["test_flow"]
+        assert summary["SlowScreen.slow_step"]["memory"]["count"] > 0
+        assert summary["*"]["cpu"]["mean"] == 5.0
+
+    def test_adb_source_parses_dumpsys(self):
+        outputs = {
+            "cpuinfo": "  12.5% 4321/io.appium.android.apis: 10% user + 2.5% kernel",
+            "meminfo": "           TOTAL    84512    51220",
+            "battery": "  level: 87",
+        }
+        runner = lambda args, timeout: outputs[args[3]]
+
+        metrics = AdbPerfSource(runner, "io.appium.android.apis").sample()
+
+        assert metrics == {"cpu": 12.5, "memory": 84512.0, "battery": 87.0}
+
+    def test_detect_regressions(self):
+        baseline = {"test_a": {"*": {"memory": {"mean": 100}, "battery": {"mean": 90}}}}
+        current = {"test_a": {"*": {"memory": {"mean": 130}, "battery": {"mean": 50}}}}
+
+        regressions = detect_regressions(current, baseline, tolerance=0.2)
+
+        assert regressions == ["test_a: memory mean 130 > baseline 100 (+30%)"]
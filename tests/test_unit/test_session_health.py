@@ -0,0 +1,62 @@
+import pytest
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
+from urllib3.exceptions import MaxRetryError
+
+from drivers.session_health import SessionDeadError, SessionHealth
+
+
+class TestSessionHealth:
+    @pytest.fixture(autouse=True)
+    def health(self):
+        self.health = SessionHealth()
+        self.health.reset()
+        yield
+        self.health.reset()
+
+    def test_fatal_errors(self):
+        errors = [
+            InvalidSessionIdException("invalid session id"),
+            WebDriverException("A session is either terminated or not started"),
+            WebDriverException(
+                "'GET /source' cannot be proxied to UiAutomator2 server because "
+                "the instrumentation process is not running (probably crashed)"
+            ),
+            MaxRetryError(None, "/session", "Connection refused"),
+            ConnectionRefusedError(),
+        ]
+        assert all(SessionHealth.is_fatal(error) for error in errors)
+
+    def test_transient_errors(self):
+        errors = [
+            NoSuchElementException("no such element"),
+            TimeoutException("Condition 'visible' failed"),
+            AssertionError(),
+        ]
+        assert not any(SessionHealth.is_fatal(error) for error in errors)
+
+    def test_breaker_fails_fast_after_trip(self):
+        self.health.guard(TimeoutException("transient"), saved_seconds=15)
+        assert not self.health.is_open
+
+        with pytest.raises(SessionDeadError):
+            self.health.guard(InvalidSessionIdException("gone"), saved_seconds=30)
+        with pytest.raises(SessionDeadError):
+            self.health.check(saved_seconds=45)
+
+        assert self.health.is_open
+        assert self.health.saved_seconds >= 75
+
+    def test_merge_worker_counters(self):
+        trips, saved = self.health.trips, self.health.saved_seconds
+        worker = {"trips": 2, "fast_failures": 3, "saved_seconds": 60.0}
+
+        self.health.merge(worker)
+
+        assert self.health.trips == trips + 2
+        assert self.health.saved_seconds == saved + 60.0
+        assert set(self.health.to_dict()) == set(worker)
@@ -0,0 +1,48 @@
+from screens.settings_profile import Profiles, SettingsManager
+
+
+class FakeDriver:
+    capabilities = {"platformName": "Android"}
+
+    def __init__(self):
+        self.settings = {"waitForIdleTimeout": 10000, "ignoreUnimportantViews": False}
+        self.updates = []
+
+    def get_settings(self):
+        return dict(self.settings)
+
+    def update_settings(self, settings):
+        self.updates.append(settings)
+        self.settings.update(settings)
+
+
+class TestSettingsManager:
+    def test_only_changed_keys_are_sent(self):
+        driver = FakeDriver()
+        manager = SettingsManager.for_driver(driver)
+
+        manager.use(Profiles.FAST)
+        manager.use(Profiles.FAST)
+        manager.use(Profiles.SHALLOW)
+
+        assert driver.updates == [
+            {"waitForIdleTimeout": 0, "ignoreUnimportantViews": True},
+            {"waitForIdleTimeout": 10000},
+        ]
+
+    def test_override_is_restored_on_exit(self):
+        driver = FakeDriver()
+        manager = SettingsManager.for_driver(driver)
+
+        with manager.override(Profiles.ANIMATED):
+            assert driver.settings["waitForIdleTimeout"] == 100
+
+        assert driver.settings["waitForIdleTimeout"] == 10000
+        assert manager is SettingsManager.for_driver(driver)
+
+    def test_no_requests_without_profiles(self):
+        driver = FakeDriver()
+
+        SettingsManager.for_driver(driver).use(None)
+
+        assert driver.updates == []
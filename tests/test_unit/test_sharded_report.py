@@ -0,0 +1,50 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.sharded_report import build_report, store_artifact
+
+
+class TestShardedReport:
+    def test_build_report_paginates_worker_shards(self, tmp_path):
+        results = tmp_path / "results"
+        results.mkdir()
+        for worker in ("gw0", "gw1"):
+            (results / f"results-{worker}.jsonl").write_text(
+                "".join(
+                    json.dumps({"nodeid": f"test_{worker}_{i}", "outcome": outcome})
+                    + "\n"
+                    for i, outcome in enumerate(["passed", "passed", "failed"])
+                )
+            )
+
+        report = build_report(str(tmp_path), page_size=4)
+
+        assert report == str(tmp_path / "report.html")
+        index = (tmp_path / "data/index.js").read_text()
+        assert '"totals": {"passed": 4, "failed": 2}, "pages": 2' in index
+        assert (tmp_path / "data/page-2.js").read_text().startswith(
+            "window.reportPage(2, [{"
+        )
+
+    def test_artifacts_are_content_addressed(self, tmp_path):
+        first = store_artifact(b"png", report_dir=str(tmp_path))
+        second = store_artifact(b"png", report_dir=str(tmp_path))
+
+        assert first == second
+        assert (tmp_path / first).read_bytes() == b"png"
+
+    def test_concurrent_writers_of_the_same_artifact(self, tmp_path):
+        data = b"png" * 100000
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            paths = set(
+                pool.map(
+                    lambda _: store_artifact(data, report_dir=str(tmp_path)), range(16)
+                )
+            )
+
+        (path,) = paths
+        assert (tmp_path / path).read_bytes() == data
+        assert [p.name for p in (tmp_path / path).parent.iterdir()] == [
+            os.path.basename(path)
+        ]